@@ -10,14 +10,22 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
 from .common import (
+    BLOCKED_RESOURCE_TYPES,
     XSL_FILE,
     check_minio_credentials,
     check_playwright_browsers,
+    fetch_all,
     fetch_page_with_playwright,
     generate_rss_feed,
+    upload_many_to_minio,
     upload_to_minio,
 )
-from .parsers import get_parser, get_content_extractor, get_metadata_extractor
+from .parsers import (
+    get_content_extractor,
+    get_metadata_extractor,
+    get_parser,
+    parse_html,
+)
 from .sites import get_all_sites, get_site_config, list_sites
 
 app = typer.Typer(
@@ -28,11 +36,80 @@ app = typer.Typer(
 console = Console()
 
 
+def print_upload_location(bucket_name: str, object_name: str) -> None:
+    """Print where an uploaded feed can be found."""
+    # Construct public URL from environment or endpoint
+    s3_public_url = (
+        os.getenv("S3_PUBLIC_URL")
+        or os.getenv("S3_ENDPOINT")
+        or os.getenv("MINIO_ENDPOINT")
+    )
+
+    if s3_public_url:
+        public_base = s3_public_url.replace("https://", "").replace("http://", "")
+        console.print(
+            f"[green]Uploaded to https://{public_base}/{bucket_name}/{object_name}[/green]"
+        )
+    else:
+        console.print(f"[green]Uploaded to bucket: {bucket_name}/{object_name}[/green]")
+
+
+def upload_pending_feeds(
+    pending_uploads: list[tuple[str, str, Optional[str]]],
+) -> list[str]:
+    """
+    Upload queued feeds concurrently, plus the XSL stylesheet once per bucket.
+
+    Args:
+        pending_uploads: (file_path, bucket_name, object_name) tuples queued
+            by process_site
+
+    Returns:
+        File paths of the feeds that failed to upload
+    """
+    console.print(f"\n[cyan]Uploading {len(pending_uploads)} feeds to MinIO...[/cyan]")
+
+    # Upload the XSL stylesheet (once per bucket) alongside the feeds
+    xsl_uploads = [
+        (str(XSL_FILE), bucket_name, "feed.xsl")
+        for bucket_name in sorted({item[1] for item in pending_uploads})
+        if not os.path.exists(f".{bucket_name}_xsl_uploaded")
+    ]
+
+    results = upload_many_to_minio(pending_uploads + xsl_uploads)
+    feed_results = results[: len(pending_uploads)]
+    xsl_results = results[len(pending_uploads) :]
+
+    for (_, bucket_name, _), uploaded in zip(xsl_uploads, xsl_results):
+        if uploaded:
+            # Create marker file to avoid re-uploading XSL
+            Path(f".{bucket_name}_xsl_uploaded").touch()
+
+    failed = []
+    for (file_path, bucket_name, object_name), uploaded in zip(
+        pending_uploads, feed_results
+    ):
+        if uploaded:
+            print_upload_location(bucket_name, object_name or file_path)
+        else:
+            console.print(f"[red]Failed to upload {file_path} to MinIO[/red]")
+            failed.append(file_path)
+
+    return failed
+
+
+# Passed as html_content when a page fetched up front failed to load, so that
+# process_site reports the failure instead of fetching the page again
+FETCH_FAILED = object()
+
+
 def process_site(
     site_id: str,
     upload: bool = True,
     bucket_name: Optional[str] = None,
     xsl_url: Optional[str] = None,
+    html_content: Optional[str] | object = None,
+    pending_uploads: Optional[list[tuple[str, str, Optional[str]]]] = None,
 ) -> bool:
     """
     Process a single site: fetch, parse, generate RSS, and optionally upload.
@@ -42,6 +119,11 @@ def process_site(
         upload: Whether to upload to MinIO
         bucket_name: MinIO bucket name
         xsl_url: Custom XSL stylesheet URL
+        html_content: Already fetched HTML of the site page (skips the fetch),
+            or FETCH_FAILED if fetching it up front failed
+        pending_uploads: If given, the feed upload is queued here as a
+            (file_path, bucket_name, object_name) tuple instead of being
+            uploaded immediately
 
     Returns:
         True if successful, False otherwise
@@ -62,10 +144,16 @@ def process_site(
         os.remove(output_file)
 
     # Fetch page
-    console.print(f"[cyan]Fetching {site_config['name']}...[/cyan]")
-    html_content = fetch_page_with_playwright(
-        site_config["url"], site_config.get("wait_time", 2000)
-    )
+    if html_content is FETCH_FAILED:
+        html_content = None
+    elif html_content is None:
+        console.print(f"[cyan]Fetching {site_config['name']}...[/cyan]")
+        html_content = fetch_page_with_playwright(
+            site_config["url"],
+            site_config.get("wait_time", 2000),
+            site_config.get("ready_selector"),
+            site_config.get("block_resources", BLOCKED_RESOURCE_TYPES),
+        )
 
     if not html_content:
         console.print(f"[red]Failed to fetch page for {site_id}[/red]")
@@ -104,25 +192,39 @@ def process_site(
         ) as progress:
             task = progress.add_task("Processing articles...", total=len(articles))
 
-            for article in articles:
-                if article.get("link"):
-                    article_html = fetch_page_with_playwright(
-                        article["link"], site_config.get("wait_time", 2000)
+            # Fetch all article pages concurrently
+            linked_articles = [article for article in articles if article.get("link")]
+            block_resources = site_config.get("block_resources", BLOCKED_RESOURCE_TYPES)
+            article_pages = fetch_all(
+                [
+                    (
+                        article["link"],
+                        site_config.get("wait_time", 2000),
+                        None,
+                        block_resources,
                     )
-                    if article_html:
-                        # Extract content
-                        if content_extractor:
-                            content = content_extractor(article_html)
-                            if content:
-                                article["content"] = content
-
-                        # Extract metadata (author, image)
-                        if metadata_extractor:
-                            metadata = metadata_extractor(article_html)
-                            if metadata.get("author"):
-                                article["author"] = metadata["author"]
-                            if metadata.get("image"):
-                                article["image"] = metadata["image"]
+                    for article in linked_articles
+                ]
+            )
+
+            for article, article_html in zip(linked_articles, article_pages):
+                if article_html:
+                    # Parse once and share the tree between both extractors
+                    article_soup = parse_html(article_html)
+
+                    # Extract content
+                    if content_extractor:
+                        content = content_extractor(article_html, article_soup)
+                        if content:
+                            article["content"] = content
+
+                    # Extract metadata (author, image)
+                    if metadata_extractor:
+                        metadata = metadata_extractor(article_html, article_soup)
+                        if metadata.get("author"):
+                            article["author"] = metadata["author"]
+                        if metadata.get("image"):
+                            article["image"] = metadata["image"]
 
                 progress.update(task, advance=1)
 
@@ -135,6 +237,10 @@ def process_site(
 
     # Upload to MinIO if requested
     if upload and check_minio_credentials():
+        if pending_uploads is not None:
+            pending_uploads.append((output_file, bucket_name, None))
+            return True
+
         console.print("[cyan]Uploading to MinIO...[/cyan]")
 
         # Upload the RSS feed
@@ -149,22 +255,7 @@ def process_site(
                 # Create marker file to avoid re-uploading XSL
                 Path(xsl_uploaded_marker).touch()
 
-        # Construct public URL from environment or endpoint
-        s3_public_url = (
-            os.getenv("S3_PUBLIC_URL")
-            or os.getenv("S3_ENDPOINT")
-            or os.getenv("MINIO_ENDPOINT")
-        )
-
-        if s3_public_url:
-            public_base = s3_public_url.replace("https://", "").replace("http://", "")
-            console.print(
-                f"[green]Uploaded to https://{public_base}/{bucket_name}/{output_file}[/green]"
-            )
-        else:
-            console.print(
-                f"[green]Uploaded to bucket: {bucket_name}/{output_file}[/green]"
-            )
+        print_upload_location(bucket_name, output_file)
     elif upload:
         console.print("[yellow]S3 credentials not configured, skipping upload[/yellow]")
 
@@ -224,21 +315,50 @@ def generate(
         sites_to_process = list_sites()
         console.print(f"[bold]Processing {len(sites_to_process)} sites...[/bold]\n")
 
+        # Fetch all site pages concurrently up front
+        console.print("[cyan]Fetching all sites...[/cyan]")
+        sites = get_all_sites()
+        site_pages = fetch_all(
+            [
+                (
+                    sites[site_id]["url"],
+                    sites[site_id].get("wait_time", 2000),
+                    sites[site_id].get("ready_selector"),
+                    sites[site_id].get("block_resources", BLOCKED_RESOURCE_TYPES),
+                )
+                for site_id in sites_to_process
+            ]
+        )
+
         success_count = 0
         failed_sites = []
+        pending_uploads = []
 
-        for site_id in sites_to_process:
+        for site_id, site_html in zip(sites_to_process, site_pages):
             console.print(f"\n[bold blue]{'=' * 60}[/bold blue]")
             console.print(f"[bold]Processing: {site_id}[/bold]")
             console.print(f"[bold blue]{'=' * 60}[/bold blue]\n")
 
             if process_site(
-                site_id, upload=not no_upload, bucket_name=bucket, xsl_url=xsl_url
+                site_id,
+                upload=not no_upload,
+                bucket_name=bucket,
+                xsl_url=xsl_url,
+                html_content=FETCH_FAILED if site_html is None else site_html,
+                pending_uploads=pending_uploads,
             ):
                 success_count += 1
             else:
                 failed_sites.append(site_id)
 
+        # Upload all generated feeds concurrently
+        if pending_uploads:
+            for file_path in upload_pending_feeds(pending_uploads):
+                for site_id in sites_to_process:
+                    if sites[site_id]["output_file"] == file_path:
+                        success_count -= 1
+                        failed_sites.append(site_id)
+
         # Summary
         console.print(f"\n[bold blue]{'=' * 60}[/bold blue]")
         console.print("[bold]Summary[/bold]")
@@ -1,15 +1,23 @@
 """Common utilities for RSS feed generation."""
 
+import asyncio
+import atexit
 import os
+from collections.abc import Collection
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from email.utils import format_datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 import boto3
-from botocore.exceptions import ClientError
+from boto3.exceptions import S3UploadFailedError
+from boto3.s3.transfer import TransferConfig
+from botocore.exceptions import BotoCoreError, ClientError
 from dotenv import load_dotenv
 from jinja2 import Environment, FileSystemLoader
+from playwright.async_api import async_playwright
 from playwright.sync_api import sync_playwright
 from rich.console import Console
 
@@ -21,6 +29,27 @@ console = Console()
 # Path to XSL stylesheet
 XSL_FILE = Path(__file__).parent / "feed.xsl"
 
+# Maximum number of pages fetched in parallel by PlaywrightSession.fetch_many
+MAX_CONCURRENT_PAGES = 3
+
+# How long to wait for a site's ready_selector to appear (milliseconds)
+READY_SELECTOR_TIMEOUT = 15000
+
+# Request types aborted while loading pages - the parsers only read the DOM, so
+# these just delay page load. Sites override this with "block_resources".
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet"})
+
+# Maximum number of files uploaded in parallel by upload_many_to_minio
+MAX_UPLOAD_WORKERS = 8
+
+# Multipart, multi-threaded transfer settings for S3 uploads
+S3_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=5 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=10,
+    use_threads=True,
+)
+
 
 def check_playwright_browsers() -> bool:
     """
@@ -42,48 +71,272 @@ def check_playwright_browsers() -> bool:
         # For other errors, assume browsers are installed but something else is wrong
         return True
 
-# Setup Jinja2 environment
+# Setup Jinja2 environment - templates ship with the package, so compile them
+# once and skip the per-render mtime check
 TEMPLATE_DIR = Path(__file__).parent / "templates"
-jinja_env = Environment(loader=FileSystemLoader(TEMPLATE_DIR))
+jinja_env = Environment(loader=FileSystemLoader(TEMPLATE_DIR), auto_reload=False)
+
+
+def _report_fetch_error(url: str, error: Exception) -> None:
+    """Print a helpful message for a failed page fetch."""
+    error_msg = str(error)
+
+    # Check if it's a missing browser error
+    if "Executable doesn't exist" in error_msg or "browsers" in error_msg.lower():
+        console.print("[red]Error: Playwright browsers are not installed![/red]\n")
+        console.print("[yellow]Please run ONE of the following commands to install browsers:[/yellow]")
+        console.print("  [cyan]rss-generator setup[/cyan]")
+        console.print("  [cyan]uv run playwright install chromium[/cyan]")
+        console.print("  [cyan]python -m playwright install chromium[/cyan]")
+        console.print("  [cyan]playwright install chromium[/cyan]")
+        console.print("\n[dim]This is a one-time setup required for web scraping.[/dim]")
+    else:
+        console.print(f"[red]Error fetching {url}: {error}[/red]")
+
+
+def _resource_blocker(block_resources: Collection[str]):
+    """
+    Build a Playwright route handler that aborts the given resource types.
+
+    Args:
+        block_resources: Request resource types to abort (e.g. "image")
+
+    Returns:
+        Route handler for context.route
+    """
+    blocked = frozenset(block_resources)
+    return lambda route: (
+        route.abort() if route.request.resource_type in blocked else route.continue_()
+    )
 
 
-def fetch_page_with_playwright(url: str, wait_time: int = 2000) -> Optional[str]:
+class PlaywrightSession:
+    """
+    Headless Chromium browser shared by every page fetch in a run.
+
+    Playwright runs on its async API inside an event loop owned by the
+    session, so single fetches and concurrent batches all go through the
+    same browser and no event loop is left running between calls. The
+    browser is launched lazily on the first fetch and reused until
+    shutdown(). Each page gets its own browser context for isolation.
+    """
+
+    launch_args = ["--disable-dev-shm-usage", "--no-sandbox"]
+
+    def __init__(self) -> None:
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._playwright = None
+        self._browser = None
+
+    def _run(self, coro):
+        """Run a coroutine to completion on the session's event loop."""
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(coro)
+
+    async def _get_browser(self):
+        """Start Playwright and launch Chromium if not already running."""
+        if self._browser is None:
+            self._playwright = await async_playwright().start()
+            try:
+                self._browser = await self._playwright.chromium.launch(
+                    headless=True, args=self.launch_args
+                )
+            except Exception:
+                await self._playwright.stop()
+                self._playwright = None
+                raise
+        return self._browser
+
+    async def _load_page(
+        self,
+        url: str,
+        wait_time: int,
+        ready_selector: Optional[str],
+        block_resources: Collection[str],
+    ) -> str:
+        """Load a page in a fresh browser context and return its HTML."""
+        browser = await self._get_browser()
+        context = await browser.new_context()
+        try:
+            if block_resources:
+                await context.route("**/*", _resource_blocker(block_resources))
+            page = await context.new_page()
+            if ready_selector:
+                await page.goto(url, wait_until="domcontentloaded")
+                await page.wait_for_selector(
+                    ready_selector, timeout=READY_SELECTOR_TIMEOUT
+                )
+            else:
+                await page.goto(url, wait_until="networkidle")
+                await page.wait_for_timeout(wait_time)
+            return await page.content()
+        finally:
+            await context.close()
+
+    async def _load_pages(
+        self, urls: list[tuple[str, int, Optional[str], Collection[str]]]
+    ) -> list[Optional[str]]:
+        """Load several pages concurrently, None for pages that failed."""
+        # Launch before fanning out so the pages don't race to start Chromium
+        await self._get_browser()
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_PAGES)
+
+        async def load_one(
+            url: str,
+            wait_time: int,
+            ready_selector: Optional[str],
+            block_resources: Collection[str],
+        ) -> Optional[str]:
+            async with semaphore:
+                try:
+                    return await self._load_page(
+                        url, wait_time, ready_selector, block_resources
+                    )
+                except Exception as e:
+                    _report_fetch_error(url, e)
+                    return None
+
+        return await asyncio.gather(*(load_one(*request) for request in urls))
+
+    def fetch(
+        self,
+        url: str,
+        wait_time: int = 2000,
+        ready_selector: Optional[str] = None,
+        block_resources: Collection[str] = BLOCKED_RESOURCE_TYPES,
+    ) -> str:
+        """
+        Fetch a single page.
+
+        Args:
+            url: The URL to fetch
+            wait_time: Time to wait for page load in milliseconds, used only
+                when no ready_selector is given
+            ready_selector: CSS selector that signals the content is rendered
+            block_resources: Request resource types to abort while loading
+
+        Returns:
+            HTML content as string
+        """
+        return self._run(
+            self._load_page(url, wait_time, ready_selector, block_resources)
+        )
+
+    def fetch_many(
+        self, urls: list[tuple[str, int, Optional[str], Collection[str]]]
+    ) -> list[Optional[str]]:
+        """
+        Fetch several pages concurrently.
+
+        Args:
+            urls: List of (url, wait_time, ready_selector, block_resources)
+                tuples, see fetch
+
+        Returns:
+            HTML content for each URL in input order, None for pages that failed
+        """
+        if not urls:
+            return []
+        try:
+            return self._run(self._load_pages(urls))
+        except Exception as e:
+            # The browser could not be started, so every page failed
+            _report_fetch_error(urls[0][0], e)
+            return [None] * len(urls)
+
+    def shutdown(self) -> None:
+        """Close the browser and stop Playwright, if they were started."""
+        if self._loop is None:
+            return
+        try:
+            if self._browser is not None:
+                self._run(self._browser.close())
+            if self._playwright is not None:
+                self._run(self._playwright.stop())
+        finally:
+            self._browser = None
+            self._playwright = None
+            self._loop.close()
+            self._loop = None
+
+
+# Browser session shared across all sites, closed once at program exit
+playwright_session = PlaywrightSession()
+atexit.register(playwright_session.shutdown)
+
+
+def fetch_page_with_playwright(
+    url: str,
+    wait_time: int = 2000,
+    ready_selector: Optional[str] = None,
+    block_resources: Collection[str] = BLOCKED_RESOURCE_TYPES,
+) -> Optional[str]:
     """
     Fetch a page using Playwright for JavaScript rendering.
 
     Args:
         url: The URL to fetch
-        wait_time: Time to wait for page load in milliseconds
+        wait_time: Time to wait for page load in milliseconds, used only when
+            no ready_selector is given
+        ready_selector: CSS selector that signals the content is rendered
+        block_resources: Request resource types to abort while loading
 
     Returns:
         HTML content as string, or None if error
     """
     try:
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-            page.goto(url, wait_until="networkidle")
-            page.wait_for_timeout(wait_time)
-            html_content = page.content()
-            browser.close()
-            return html_content
+        return playwright_session.fetch(url, wait_time, ready_selector, block_resources)
     except Exception as e:
-        error_msg = str(e)
+        _report_fetch_error(url, e)
+        return None
 
-        # Check if it's a missing browser error
-        if "Executable doesn't exist" in error_msg or "browsers" in error_msg.lower():
-            console.print("[red]Error: Playwright browsers are not installed![/red]\n")
-            console.print("[yellow]Please run ONE of the following commands to install browsers:[/yellow]")
-            console.print("  [cyan]rss-generator setup[/cyan]")
-            console.print("  [cyan]uv run playwright install chromium[/cyan]")
-            console.print("  [cyan]python -m playwright install chromium[/cyan]")
-            console.print("  [cyan]playwright install chromium[/cyan]")
-            console.print("\n[dim]This is a one-time setup required for web scraping.[/dim]")
-        else:
-            console.print(f"[red]Error fetching {url}: {e}[/red]")
 
+def fetch_all(
+    urls: list[tuple[str, int, Optional[str], Collection[str]]],
+) -> list[Optional[str]]:
+    """
+    Fetch several pages concurrently with the shared browser session.
+
+    Args:
+        urls: List of (url, wait_time, ready_selector, block_resources)
+            tuples, see fetch_page_with_playwright
+
+    Returns:
+        HTML content for each URL in input order, None for pages that failed
+    """
+    return playwright_session.fetch_many(urls)
+
+
+def _parse_date(date_str: str) -> Optional[datetime]:
+    """
+    Parse an article date string, dispatching on its shape.
+
+    Supports "2023-12-30", ISO 8601 datetimes ("2023-12-30T10:00:00"),
+    "December 30, 2023" and "Dec 30, 2023". Naive dates are taken as UTC.
+
+    Args:
+        date_str: Date string to parse
+
+    Returns:
+        Timezone-aware datetime, or None if the format is not recognised
+    """
+    try:
+        if len(date_str) == 10 and date_str[4] == "-":
+            dt = datetime.strptime(date_str, "%Y-%m-%d")
+        elif "T" in date_str:
+            dt = datetime.fromisoformat(date_str)
+        elif len(date_str.split(" ", 1)[0]) == 3:
+            dt = datetime.strptime(date_str, "%b %d, %Y")
+        else:
+            dt = datetime.strptime(date_str, "%B %d, %Y")
+    except ValueError:
         return None
 
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt
+
 
 def generate_rss_feed(
     articles: list[dict],
@@ -171,20 +424,9 @@ def generate_rss_feed(
                 try:
                     if isinstance(article["date"], str):
                         date_str = article["date"].strip()
-                        date_formats = [
-                            "%Y-%m-%d",
-                            "%Y-%m-%dT%H:%M:%S",
-                            "%B %d, %Y",
-                            "%b %d, %Y",
-                        ]
-                        for fmt in date_formats:
-                            try:
-                                dt = datetime.strptime(date_str, fmt)
-                                dt = dt.replace(tzinfo=timezone.utc)
-                                item["pub_date"] = format_datetime(dt)
-                                break
-                            except (ValueError, AttributeError):
-                                continue
+                        dt = _parse_date(date_str)
+                        if dt is not None:
+                            item["pub_date"] = format_datetime(dt)
 
                         if "pub_date" not in item:
                             console.print(
@@ -195,16 +437,13 @@ def generate_rss_feed(
 
             items.append(item)
 
-        # Render RSS feed from template
+        # Render RSS feed from template, streaming it straight to the file
+        # (the XSL stylesheet PI is part of the template, so no second pass)
         template = jinja_env.get_template("rss_feed.xml")
-        rss_content = template.render(
-            xsl_url=final_xsl_url, channel=channel, items=items
+        template.stream(xsl_url=final_xsl_url, channel=channel, items=items).dump(
+            output_file, encoding="utf-8"
         )
 
-        # Write to file
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write(rss_content)
-
         return True
     except Exception as e:
         console.print(f"[red]Error generating RSS feed: {e}[/red]")
@@ -214,36 +453,22 @@ def generate_rss_feed(
         return False
 
 
-def upload_to_minio(
-    file_path: str, bucket_name: str, object_name: Optional[str] = None
-) -> bool:
+@lru_cache(maxsize=1)
+def _get_s3_client(
+    access_key: str, secret_key: str, endpoint: Optional[str], region: str
+):
     """
-    Upload a file to S3-compatible bucket (MinIO, AWS S3, etc.).
+    Create an S3 client, reused across uploads while the configuration is unchanged.
 
     Args:
-        file_path: Path to file to upload
-        bucket_name: Name of the bucket
-        object_name: S3 object name. If not specified, file_path basename is used
+        access_key: S3 access key
+        secret_key: S3 secret key
+        endpoint: Endpoint URL for MinIO/S3-compatible services, None for AWS S3
+        region: S3 region name
 
     Returns:
-        True if file was uploaded, else False
+        boto3 S3 client
     """
-    # Get credentials from environment variables (support both S3 and MINIO prefixes)
-    access_key = os.getenv("S3_ACCESS_KEY", os.getenv("MINIO_ACCESS_KEY"))
-    secret_key = os.getenv("S3_SECRET_KEY", os.getenv("MINIO_SECRET_KEY"))
-    endpoint = os.getenv("S3_ENDPOINT", os.getenv("MINIO_ENDPOINT"))
-
-    if not access_key or not secret_key:
-        console.print("[yellow]S3 credentials not found in environment[/yellow]")
-        return False
-
-    # If S3 object_name was not specified, use file_path basename
-    if object_name is None:
-        object_name = os.path.basename(file_path)
-
-    # Get region (required for AWS S3, optional for MinIO)
-    region = os.getenv("S3_REGION") or os.getenv("AWS_DEFAULT_REGION") or "us-east-1"
-
     # Create S3 client config
     s3_config = {
         "aws_access_key_id": access_key,
@@ -259,8 +484,38 @@ def upload_to_minio(
             endpoint = f"https://{endpoint}"
         s3_config["endpoint_url"] = endpoint
 
-    # Create S3 client
-    s3_client = boto3.client("s3", **s3_config)
+    return boto3.client("s3", **s3_config)
+
+
+def _get_s3_client_from_env():
+    """
+    Get the S3 client configured from environment variables.
+
+    Returns:
+        boto3 S3 client, or None if credentials are not configured
+    """
+    # Get credentials from environment variables (support both S3 and MINIO prefixes)
+    access_key = os.getenv("S3_ACCESS_KEY", os.getenv("MINIO_ACCESS_KEY"))
+    secret_key = os.getenv("S3_SECRET_KEY", os.getenv("MINIO_SECRET_KEY"))
+    endpoint = os.getenv("S3_ENDPOINT", os.getenv("MINIO_ENDPOINT"))
+
+    if not access_key or not secret_key:
+        console.print("[yellow]S3 credentials not found in environment[/yellow]")
+        return None
+
+    # Get region (required for AWS S3, optional for MinIO)
+    region = os.getenv("S3_REGION") or os.getenv("AWS_DEFAULT_REGION") or "us-east-1"
+
+    return _get_s3_client(access_key, secret_key, endpoint, region)
+
+
+def _upload_file(
+    s3_client, file_path: str, bucket_name: str, object_name: Optional[str] = None
+) -> bool:
+    """Upload a single file with the given client, returning True on success."""
+    # If S3 object_name was not specified, use file_path basename
+    if object_name is None:
+        object_name = os.path.basename(file_path)
 
     try:
         s3_client.upload_file(
@@ -268,13 +523,60 @@ def upload_to_minio(
             bucket_name,
             object_name,
             ExtraArgs={"ContentType": "application/rss+xml"},
+            Config=S3_TRANSFER_CONFIG,
         )
         return True
-    except ClientError as e:
+    # upload_file wraps S3 errors in S3UploadFailedError, an unreachable
+    # endpoint raises BotoCoreError and OSError covers a missing local file
+    except (ClientError, S3UploadFailedError, BotoCoreError, OSError) as e:
         console.print(f"[red]Error uploading to S3: {e}[/red]")
         return False
 
 
+def upload_to_minio(
+    file_path: str, bucket_name: str, object_name: Optional[str] = None
+) -> bool:
+    """
+    Upload a file to S3-compatible bucket (MinIO, AWS S3, etc.).
+
+    Args:
+        file_path: Path to file to upload
+        bucket_name: Name of the bucket
+        object_name: S3 object name. If not specified, file_path basename is used
+
+    Returns:
+        True if file was uploaded, else False
+    """
+    s3_client = _get_s3_client_from_env()
+    if s3_client is None:
+        return False
+
+    return _upload_file(s3_client, file_path, bucket_name, object_name)
+
+
+def upload_many_to_minio(items: list[tuple[str, str, Optional[str]]]) -> list[bool]:
+    """
+    Upload several files concurrently to S3-compatible bucket(s).
+
+    Args:
+        items: List of (file_path, bucket_name, object_name) tuples, see
+            upload_to_minio
+
+    Returns:
+        Upload result for each item in input order
+    """
+    if not items:
+        return []
+
+    s3_client = _get_s3_client_from_env()
+    if s3_client is None:
+        return [False] * len(items)
+
+    # boto3 clients are thread-safe, so all workers share the cached client
+    with ThreadPoolExecutor(max_workers=min(MAX_UPLOAD_WORKERS, len(items))) as pool:
+        return list(pool.map(lambda item: _upload_file(s3_client, *item), items))
+
+
 def check_minio_credentials() -> bool:
     """Check if S3 credentials are configured."""
     access_key = os.getenv("S3_ACCESS_KEY", os.getenv("MINIO_ACCESS_KEY"))
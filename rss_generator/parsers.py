@@ -1,15 +1,107 @@
 """Site-specific parsers for extracting articles from HTML."""
 
 import re
+from collections.abc import Iterator
 from datetime import datetime
 from typing import Optional
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup, Comment
+from bs4 import BeautifulSoup, Comment, Tag
 from rich.console import Console
 
+try:
+    from selectolax.lexbor import LexborHTMLParser
+
+    _FAST = True
+except ImportError:
+    _FAST = False
+
 console = Console()
 
+# BeautifulSoup tree builder used by every parser (C-backed, much faster than
+# the pure-Python "html.parser")
+PARSER = "lxml"
+
+# Elements dropped entirely by clean_html_content
+_UNWANTED_TAGS = frozenset(
+    {"nav", "header", "footer", "aside", "script", "style", "svg", "button", "form"}
+)
+# Attributes kept by clean_html_content - everything else is stripped
+_ALLOWED_ATTRS = frozenset({"href", "src", "alt", "title", "class"})
+
+# Month names indexed by month number (index 0 is unused)
+_MONTHS = (
+    "",
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
+)
+_MONTH_INDEX = {name: number for number, name in enumerate(_MONTHS) if name}
+
+# Precompiled regular expressions used by the parsers
+_MONTHS_LONG = "|".join(_MONTHS[1:])
+_MONTHS_SHORT = "Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec"
+
+_BLANK_LINES = re.compile(r"\n\s*\n")
+_MULTIPLE_SPACES = re.compile(r"  +")
+
+_MONTH_LONG_DATE = re.compile(rf"({_MONTHS_LONG})\s+\d{{1,2}},\s+\d{{4}}")
+_MONTH_SHORT_DATE = re.compile(rf"({_MONTHS_SHORT})\s+\d{{1,2}},\s+\d{{4}}")
+_MONTH_LONG_SUFFIX = re.compile(rf"({_MONTHS_LONG})\s+\d{{1,2}},\s+\d{{4}}.*$")
+_MONTH_SHORT_SUFFIX = re.compile(rf"({_MONTHS_SHORT})\s+\d{{1,2}},\s+\d{{4}}.*$")
+_AUTHOR_SUFFIX = re.compile(r"—\s*.*$")
+_URL_DATE = re.compile(r"/(\d{4})-(\d{2})-(\d{2})")
+
+# Case-insensitive class and href matchers for find/find_all - bs4 checks
+# these with re.search, which is cheaper than a Python callback or soupsieve
+_POST_CLASS = re.compile("post|blog", re.IGNORECASE)
+_DATE_CLASS = re.compile("date", re.IGNORECASE)
+_EXCERPT_CLASS = re.compile("excerpt|description", re.IGNORECASE)
+_ARTICLE_CLASS = re.compile("article|content", re.IGNORECASE)
+_AUTHOR_CLASS = re.compile("author", re.IGNORECASE)
+# Blog post links, excluding the blog index itself
+_BLOG_POST_HREF = re.compile(r"\A(?!/blog/\Z).*/blog/", re.DOTALL)
+
+_NOTICIAS_HREF = re.compile("/noticias/")
+_NOTICIAS_URL_DATE = re.compile(r"/(\d{4}-\d{2}-\d{2})-")
+_NOTICIAS_CATEGORY = re.compile(r"/noticias/([^/]+)/")
+
+_DATE_ON = re.compile(rf"On\s+({_MONTHS_LONG})\s+-\s+(\d{{1,2}})\s+-\s+(\d{{4}})")
+# Matched inside a lookahead so matches can overlap: like a separate search
+# per field, a label inside an earlier field's value is still found
+_ENTRY_FIELDS = re.compile(r"(?=(Artist|Album|Released|Style|Format|Size):\s*([^\n]+))")
+# Maps entry field labels to album dictionary keys
+_ENTRY_FIELD_KEYS = {
+    "Artist": "artist",
+    "Album": "album_name",
+    "Released": "released",
+    "Style": "style",
+    "Format": "format",
+    "Size": "size",
+}
+
+
+def parse_html(html_content: str) -> BeautifulSoup:
+    """
+    Parse an HTML page once so it can be shared between extractors.
+
+    Args:
+        html_content: HTML content of the page
+
+    Returns:
+        Parsed BeautifulSoup tree
+    """
+    return BeautifulSoup(html_content, PARSER)
+
 
 def clean_html_content(html: str) -> str:
     """
@@ -22,55 +114,51 @@ def clean_html_content(html: str) -> str:
         Cleaned HTML string
     """
     try:
-        soup = BeautifulSoup(html, "html.parser")
-
-        # Remove unwanted elements
-        unwanted_tags = [
-            "nav",
-            "header",
-            "footer",
-            "aside",
-            "script",
-            "style",
-            "svg",
-            "button",
-            "form",
-        ]
-        for tag_name in unwanted_tags:
-            for element in soup.find_all(tag_name):
-                element.decompose()
-
-        # Remove HTML comments
-        for comment in soup.find_all(string=lambda text: isinstance(text, Comment)):
-            comment.extract()
-
-        # Remove elements with 'muted' class (typically navigation breadcrumbs)
-        for element in soup.find_all(class_="muted"):
-            element.decompose()
-
-        # Remove short ul/ol lists that are likely navigation
-        for ul in list(soup.find_all(["ul", "ol"])):
+        soup = BeautifulSoup(html, PARSER)
+
+        # Remove unwanted elements, comments and 'muted' elements (typically
+        # navigation breadcrumbs) and strip attributes in a single tree walk
+        lists = []
+        for node in list(soup.descendants):
+            # Skip nodes inside an already removed subtree
+            if node.decomposed:
+                continue
+
+            if isinstance(node, Comment):
+                node.extract()
+                continue
+
+            if not isinstance(node, Tag):
+                continue
+
+            if node.name in _UNWANTED_TAGS or "muted" in node.get("class", ()):
+                node.decompose()
+                continue
+
+            if node.name in ("ul", "ol"):
+                lists.append(node)
+
+            # Clean up attributes - keep only essential ones
+            node.attrs = {k: v for k, v in node.attrs.items() if k in _ALLOWED_ATTRS}
+
+        # Remove short ul/ol lists that are likely navigation (checked after
+        # the walk so removed children no longer count towards their text)
+        for ul in lists:
+            if ul.decomposed:
+                continue
             text = ul.get_text(strip=True)
-            links = ul.find_all("a")
             # If it's short and has links, probably navigation
-            if len(text) < 100 and len(links) > 0:
+            if len(text) < 100 and ul.find("a"):
                 ul.decompose()
 
-        # Clean up attributes - keep only essential ones
-        allowed_attrs = {"href", "src", "alt", "title", "class"}
-        for tag in soup.find_all(True):
-            attrs_to_remove = [
-                attr for attr in list(tag.attrs.keys()) if attr not in allowed_attrs
-            ]
-            for attr in attrs_to_remove:
-                del tag[attr]
-
-        # Get the cleaned HTML
-        cleaned = str(soup)
+        # Get the cleaned HTML - lxml wraps fragments in <html><body>, so
+        # serialize only the body contents
+        root = soup.body or soup
+        cleaned = "".join(str(child) for child in root.contents)
 
         # Remove excessive whitespace
-        cleaned = re.sub(r"\n\s*\n", "\n", cleaned)
-        cleaned = re.sub(r"  +", " ", cleaned)
+        cleaned = _BLANK_LINES.sub("\n", cleaned)
+        cleaned = _MULTIPLE_SPACES.sub(" ", cleaned)
 
         return cleaned
     except Exception as e:
@@ -79,37 +167,102 @@ def clean_html_content(html: str) -> str:
         return html
 
 
-def parse_immich(html_content: str, url: str) -> list[dict]:
+_HEADING_TAGS = frozenset({"h1", "h2", "h3", "h4"})
+
+
+def _first_post_elements(article: Tag) -> dict[str, Optional[Tag]]:
     """
-    Parse Immich blog posts.
+    Find the first heading, link, time and paragraph of a post in one walk.
+
+    Args:
+        article: Post element to search
+
+    Returns:
+        Dictionary with "heading", "link", "time" and "p" keys (None when missing)
+    """
+    found = {"heading": None, "link": None, "time": None, "p": None}
+    missing = len(found)
+    for node in article.descendants:
+        if not isinstance(node, Tag):
+            continue
+        name = node.name
+        if name in _HEADING_TAGS:
+            key = "heading"
+        elif name == "a" and node.has_attr("href"):
+            key = "link"
+        elif name == "time" or name == "p":
+            key = name
+        else:
+            continue
+        if found[key] is None:
+            found[key] = node
+            missing -= 1
+            if not missing:
+                break
+    return found
+
+
+def _url_date(href: str) -> Optional[str]:
+    """
+    Extract a date from a URL pattern (e.g., /2023-12-30-title).
+
+    Args:
+        href: Link to search
+
+    Returns:
+        Date in YYYY-MM-DD format, or None if the URL has no date
+    """
+    date_match = _URL_DATE.search(href)
+    if date_match:
+        return f"{date_match.group(1)}-{date_match.group(2)}-{date_match.group(3)}"
+    return None
+
+
+def _text_date(text: str) -> Optional[str]:
+    """
+    Find a date like "December 30, 2023" or "Dec 30, 2023" in text.
+
+    Args:
+        text: Text to search
+
+    Returns:
+        Matched date text, or None if no date was found
+    """
+    for pattern in (_MONTH_LONG_DATE, _MONTH_SHORT_DATE):
+        match = pattern.search(text)
+        if match:
+            return match.group(0)
+    return None
+
+
+def _immich_posts_soup(
+    html_content: str,
+) -> Iterator[tuple[str, str, Optional[str], Optional[str]]]:
+    """
+    Yield the raw fields of every blog post using BeautifulSoup.
 
     Args:
         html_content: HTML content of the page
-        url: Base URL for resolving relative links
 
     Returns:
-        List of article dictionaries
+        Iterator of (title text, href, date, description) tuples, the date
+        and description being None when the post has none
     """
-    soup = BeautifulSoup(html_content, "html.parser")
-    posts = []
+    soup = BeautifulSoup(html_content, PARSER)
 
     # Try to find blog post articles
-    articles = soup.find_all(
-        ["article", "div"],
-        class_=lambda x: x and ("post" in x.lower() or "blog" in x.lower()),
-    )
+    articles = soup.find_all(["article", "div"], class_=_POST_CLASS)
 
     if not articles:
         # Fallback: look for links that might be blog posts
-        articles = soup.find_all(
-            "a", href=lambda x: x and "/blog/" in x and x != "/blog" and x != "/blog/"
-        )
+        articles = soup.find_all("a", href=_BLOG_POST_HREF)
 
     for article in articles:
-        post = {}
+        # Collect the elements used below in a single pass over the post
+        elements = _first_post_elements(article)
 
         # Extract title
-        title_elem = article.find(["h1", "h2", "h3", "h4"])
+        title_elem = elements["heading"]
         if title_elem:
             title_text = title_elem.get_text(strip=True)
         elif article.name == "a":
@@ -117,88 +270,139 @@ def parse_immich(html_content: str, url: str) -> list[dict]:
         else:
             continue
 
-        # Clean title - remove date and author suffix patterns
-        # Patterns like "TitleDecember 30, 2023— Author"
-        title_text = re.sub(
-            r"(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},\s+\d{4}.*$",
-            "",
-            title_text,
-        )
-        title_text = re.sub(
-            r"(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2},\s+\d{4}.*$",
-            "",
+        # Extract link
+        link_elem = elements["link"] if article.name != "a" else article
+        if not link_elem:
+            continue
+        href = link_elem["href"]
+
+        # Extract date - time element with datetime attribute, then elements
+        # with date in class name, then the URL, then the article text
+        date = None
+        time_elem = elements["time"]
+        if time_elem and time_elem.get("datetime"):
+            date = time_elem["datetime"]
+        if not date:
+            date_elem = article.find(["time", "span", "div"], class_=_DATE_CLASS)
+            if date_elem:
+                date = date_elem.get("datetime") or date_elem.get_text(strip=True)
+        if not date:
+            date = _url_date(href) or _text_date(article.get_text())
+
+        # Extract description/excerpt, or else the first paragraph
+        desc_elem = article.find(["p", "div"], class_=_EXCERPT_CLASS) or elements["p"]
+
+        yield (
             title_text,
+            href,
+            date,
+            desc_elem.get_text(strip=True) if desc_elem else None,
         )
-        # Remove author patterns like "— AuthorName"
-        title_text = re.sub(r"—\s*.*$", "", title_text)
-        post["title"] = title_text.strip()
 
-        # Extract link
-        link_elem = article.find("a", href=True) if article.name != "a" else article
-        if link_elem:
-            post["link"] = urljoin(url, link_elem["href"])
-        else:
-            continue
 
-        # Extract date - try multiple methods
-        post["date"] = None
+def _immich_posts_fast(
+    html_content: str,
+) -> Iterator[tuple[str, str, Optional[str], Optional[str]]]:
+    """
+    Yield the raw fields of every blog post using selectolax.
 
-        # Try 1: Look for time element with datetime attribute
-        time_elem = article.find("time")
-        if time_elem and time_elem.get("datetime"):
-            post["date"] = time_elem["datetime"]
+    Args:
+        html_content: HTML content of the page
 
-        # Try 2: Look for elements with date in class name
-        if not post["date"]:
-            date_elem = article.find(
-                ["time", "span", "div"], class_=lambda x: x and "date" in x.lower()
-            )
+    Returns:
+        Iterator of (title text, href, date, description) tuples, the date
+        and description being None when the post has none
+    """
+    tree = LexborHTMLParser(html_content)
+    # Match BeautifulSoup, which leaves script/style out of get_text()
+    tree.strip_tags(["script", "style"])
+
+    # Try to find blog post articles
+    articles = tree.css(':is(article, div):is([class*="post" i], [class*="blog" i])')
+
+    if not articles:
+        # Fallback: look for links that might be blog posts
+        articles = tree.css('a[href*="/blog/"]:not([href="/blog/"])')
+
+    for article in articles:
+        # Extract title
+        title_elem = article.css_first("h1, h2, h3, h4")
+        if title_elem:
+            title_text = title_elem.text(strip=True)
+        elif article.tag == "a":
+            title_text = article.text(strip=True)
+        else:
+            continue
+
+        # Extract link
+        link_elem = article.css_first("a[href]") if article.tag != "a" else article
+        if not link_elem:
+            continue
+        href = link_elem.attributes["href"]
+
+        # Extract date - time element with datetime attribute, then elements
+        # with date in class name, then the URL, then the article text
+        date = None
+        time_elem = article.css_first("time")
+        if time_elem:
+            date = time_elem.attributes.get("datetime")
+        if not date:
+            date_elem = article.css_first(':is(time, span, div)[class*="date" i]')
             if date_elem:
-                post["date"] = date_elem.get("datetime") or date_elem.get_text(
+                date = date_elem.attributes.get("datetime") or date_elem.text(
                     strip=True
                 )
+        if not date:
+            date = _url_date(href) or _text_date(article.text())
 
-        # Try 3: Extract from URL pattern (e.g., /2023-12-30-title)
-        if not post["date"] and link_elem:
-            link_text = link_elem["href"]
-            date_match = re.search(r"/(\d{4})-(\d{2})-(\d{2})", link_text)
-            if date_match:
-                post["date"] = (
-                    f"{date_match.group(1)}-{date_match.group(2)}-{date_match.group(3)}"
-                )
+        # Extract description/excerpt, or else the first paragraph
+        desc_elem = article.css_first(
+            ':is(p, div):is([class*="excerpt" i], [class*="description" i])'
+        ) or article.css_first("p")
+
+        yield (
+            title_text,
+            href,
+            date,
+            desc_elem.text(strip=True) if desc_elem else None,
+        )
 
-        # Try 4: Look in article text for common date patterns
-        if not post["date"]:
-            text = article.get_text()
-            # Match patterns like "December 30, 2023", "Dec 30, 2023"
-            date_patterns = [
-                r"(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},\s+\d{4}",
-                r"(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2},\s+\d{4}",
-            ]
-            for pattern in date_patterns:
-                match = re.search(pattern, text)
-                if match:
-                    post["date"] = match.group(0)
-                    break
+
+def parse_immich(html_content: str, url: str) -> list[dict]:
+    """
+    Parse Immich blog posts.
+
+    Args:
+        html_content: HTML content of the page
+        url: Base URL for resolving relative links
+
+    Returns:
+        List of article dictionaries
+    """
+    posts = []
+    # Fallback date for entries without one, computed once per page
+    today = datetime.now().strftime("%Y-%m-%d")
+
+    # Find all blog posts
+    entries = _immich_posts_fast if _FAST else _immich_posts_soup
+
+    for title_text, href, date, desc_text in entries(html_content):
+        post = {}
+
+        # Clean title - remove date and author suffix patterns
+        # Patterns like "TitleDecember 30, 2023— Author"
+        title_text = _MONTH_LONG_SUFFIX.sub("", title_text)
+        title_text = _MONTH_SHORT_SUFFIX.sub("", title_text)
+        # Remove author patterns like "— AuthorName"
+        title_text = _AUTHOR_SUFFIX.sub("", title_text)
+        post["title"] = title_text.strip()
+
+        post["link"] = urljoin(url, href)
 
         # Fallback: use current date if nothing found
-        if not post["date"]:
-            post["date"] = datetime.now().strftime("%Y-%m-%d")
-
-        # Extract description/excerpt
-        desc_elem = article.find(
-            ["p", "div"],
-            class_=lambda x: x
-            and ("excerpt" in x.lower() or "description" in x.lower()),
-        )
-        if desc_elem:
-            post["description"] = desc_elem.get_text(strip=True)
-        else:
-            # Try to get first paragraph
-            p_elem = article.find("p")
-            post["description"] = (
-                p_elem.get_text(strip=True) if p_elem else post["title"]
-            )
+        post["date"] = date or today
+
+        post["description"] = desc_text if desc_text is not None else post["title"]
 
         if post.get("title") and post.get("link"):
             posts.append(post)
@@ -206,6 +410,58 @@ def parse_immich(html_content: str, url: str) -> list[dict]:
     return posts
 
 
+def _noticia_links_soup(
+    html_content: str,
+) -> Iterator[tuple[str, str, str, Optional[str]]]:
+    """
+    Yield the raw fields of every news link using BeautifulSoup.
+
+    Args:
+        html_content: HTML content of the page
+
+    Returns:
+        Iterator of (href, heading text, link text, first paragraph text)
+        tuples, the paragraph text being None when the link has no <p>
+    """
+    soup = BeautifulSoup(html_content, PARSER)
+    for article in soup.find_all("a", href=_NOTICIAS_HREF):
+        title_elem = article.find(["h1", "h2", "h3", "h4", "span"])
+        desc_elem = article.find("p")
+        yield (
+            article["href"],
+            title_elem.get_text(strip=True) if title_elem else "",
+            article.get_text(strip=True),
+            desc_elem.get_text(strip=True) if desc_elem else None,
+        )
+
+
+def _noticia_links_fast(
+    html_content: str,
+) -> Iterator[tuple[str, str, str, Optional[str]]]:
+    """
+    Yield the raw fields of every news link using selectolax.
+
+    Args:
+        html_content: HTML content of the page
+
+    Returns:
+        Iterator of (href, heading text, link text, first paragraph text)
+        tuples, the paragraph text being None when the link has no <p>
+    """
+    tree = LexborHTMLParser(html_content)
+    # Match BeautifulSoup, which leaves script/style out of get_text()
+    tree.strip_tags(["script", "style"])
+    for article in tree.css('a[href*="/noticias/"]'):
+        title_elem = article.css_first("h1, h2, h3, h4, span")
+        desc_elem = article.css_first("p")
+        yield (
+            article.attributes["href"],
+            title_elem.text(strip=True) if title_elem else "",
+            article.text(strip=True),
+            desc_elem.text(strip=True) if desc_elem else None,
+        )
+
+
 def parse_diariodominho(html_content: str, url: str) -> list[dict]:
     """
     Parse Diário do Minho news articles.
@@ -217,64 +473,49 @@ def parse_diariodominho(html_content: str, url: str) -> list[dict]:
     Returns:
         List of article dictionaries
     """
-    soup = BeautifulSoup(html_content, "html.parser")
     articles_list = []
+    # Fallback date for entries without one, computed once per page
+    today = datetime.now().strftime("%Y-%m-%d")
     seen_links = set()
+    seen_add = seen_links.add
 
     # Find all article links
-    articles = soup.find_all("a", href=lambda x: x and "/noticias/" in x)
-
-    for article in articles:
-        # Extract link
-        link = article.get("href")
-        if not link:
-            continue
+    links = _noticia_links_fast if _FAST else _noticia_links_soup
 
+    for link, heading_text, link_text, desc_text in links(html_content):
         # Make absolute URL
         full_link = urljoin(url, link)
 
         # Skip duplicates
         if full_link in seen_links:
             continue
-        seen_links.add(full_link)
+        seen_add(full_link)
 
         article_data = {"link": full_link}
 
-        # Extract title - try different elements
-        title_elem = article.find(["h1", "h2", "h3", "h4", "span"])
-        if title_elem:
-            title = title_elem.get_text(strip=True)
-            if title and len(title) > 5:
-                article_data["title"] = title
-            else:
-                title = article.get_text(strip=True)
-                if title and len(title) > 5:
-                    article_data["title"] = title
-                else:
-                    continue
+        # Extract title - prefer a heading, fall back to the whole link text
+        if len(heading_text) > 5:
+            article_data["title"] = heading_text
+        elif len(link_text) > 5:
+            article_data["title"] = link_text
         else:
-            title = article.get_text(strip=True)
-            if title and len(title) > 5:
-                article_data["title"] = title
-            else:
-                continue
+            continue
 
         # Try to extract date from URL (format: 2025-10-01)
-        date_match = re.search(r"/(\d{4}-\d{2}-\d{2})-", full_link)
+        date_match = _NOTICIAS_URL_DATE.search(full_link)
         if date_match:
             article_data["date"] = date_match.group(1)
         else:
-            article_data["date"] = datetime.now().strftime("%Y-%m-%d")
+            article_data["date"] = today
 
         # Extract category from URL
-        category_match = re.search(r"/noticias/([^/]+)/", full_link)
+        category_match = _NOTICIAS_CATEGORY.search(full_link)
         if category_match:
             article_data["category"] = category_match.group(1).title()
 
-        # Try to find description
-        desc_elem = article.find("p")
-        if desc_elem:
-            article_data["description"] = desc_elem.get_text(strip=True)
+        # Use the first paragraph as description, even if it is empty
+        if desc_text is not None:
+            article_data["description"] = desc_text
         else:
             article_data["description"] = article_data["title"]
 
@@ -284,124 +525,141 @@ def parse_diariodominho(html_content: str, url: str) -> list[dict]:
     return articles_list
 
 
-def parse_newalbumreleases_metal(html_content: str, url: str) -> list[dict]:
+def _album_entries_soup(
+    html_content: str,
+) -> Iterator[tuple[str, str, Optional[str], Optional[str], Optional[str]]]:
     """
-    Parse New Album Releases metal category.
+    Yield the raw fields of every album entry using BeautifulSoup.
 
     Args:
         html_content: HTML content of the page
-        url: Base URL for resolving relative links
 
     Returns:
-        List of article dictionaries
+        Iterator of (title, link, date text, image, entry text) tuples
     """
-    soup = BeautifulSoup(html_content, "html.parser")
-    albums = []
-    seen_links = set()
+    soup = BeautifulSoup(html_content, PARSER)
+    for single in soup.find_all("div", class_="single"):
+        h2 = single.find("h2")
+        link_elem = h2.find("a", href=True) if h2 else None
+        if not link_elem:
+            continue
 
-    # Find all album entries
-    singles = soup.find_all("div", class_="single")
+        date_text = None
+        date_div = single.find("div", class_="date")
+        clock_span = date_div.find("span", class_="clock") if date_div else None
+        if clock_span:
+            date_text = clock_span.get_text(strip=True)
 
-    for single in singles:
-        album = {}
+        image = entry_text = None
+        entry_div = single.find("div", class_="entry")
+        if entry_div:
+            img = entry_div.find("img")
+            image = img.get("src") if img else None
+            entry_text = entry_div.get_text()
 
-        # Extract title and link
-        h2 = single.find("h2")
-        if not h2:
-            continue
+        yield (
+            link_elem.get_text(strip=True),
+            link_elem["href"],
+            date_text,
+            image,
+            entry_text,
+        )
 
-        link_elem = h2.find("a", href=True)
-        if not link_elem:
-            continue
 
-        album["title"] = link_elem.get_text(strip=True)
-        album["link"] = link_elem["href"]
+def _album_entries_fast(
+    html_content: str,
+) -> Iterator[tuple[str, str, Optional[str], Optional[str], Optional[str]]]:
+    """
+    Yield the raw fields of every album entry using selectolax.
 
-        # Skip duplicates
-        if album["link"] in seen_links:
+    Args:
+        html_content: HTML content of the page
+
+    Returns:
+        Iterator of (title, link, date text, image, entry text) tuples
+    """
+    tree = LexborHTMLParser(html_content)
+    for single in tree.css("div.single"):
+        h2 = single.css_first("h2")
+        link_elem = h2.css_first("a[href]") if h2 else None
+        if not link_elem:
             continue
-        seen_links.add(album["link"])
 
-        # Extract date from the date div
-        date_div = single.find("div", class_="date")
-        if date_div:
-            clock_span = date_div.find("span", class_="clock")
-            if clock_span:
-                # Format: " On September - 29 - 2025"
-                date_text = clock_span.get_text(strip=True)
-                date_match = re.search(
-                    r"On\s+(January|February|March|April|May|June|July|August|September|October|November|December)\s+-\s+(\d{1,2})\s+-\s+(\d{4})",
-                    date_text,
-                )
-                if date_match:
-                    month_name = date_match.group(1)
-                    day = date_match.group(2).zfill(2)
-                    year = date_match.group(3)
-
-                    # Convert month name to number
-                    month_map = {
-                        "January": "01",
-                        "February": "02",
-                        "March": "03",
-                        "April": "04",
-                        "May": "05",
-                        "June": "06",
-                        "July": "07",
-                        "August": "08",
-                        "September": "09",
-                        "October": "10",
-                        "November": "11",
-                        "December": "12",
-                    }
-                    month = month_map.get(month_name, "01")
-                    album["date"] = f"{year}-{month}-{day}"
-                else:
-                    album["date"] = datetime.now().strftime("%Y-%m-%d")
-            else:
-                album["date"] = datetime.now().strftime("%Y-%m-%d")
-        else:
-            album["date"] = datetime.now().strftime("%Y-%m-%d")
+        date_text = None
+        date_div = single.css_first("div.date")
+        clock_span = date_div.css_first("span.clock") if date_div else None
+        if clock_span:
+            date_text = clock_span.text(strip=True)
 
-        # Extract album details from the entry div
-        entry_div = single.find("div", class_="entry")
+        image = entry_text = None
+        entry_div = single.css_first("div.entry")
         if entry_div:
-            # Extract image
-            img = entry_div.find("img")
-            if img and img.get("src"):
-                album["image"] = img["src"]
+            img = entry_div.css_first("img")
+            image = img.attributes.get("src") if img else None
+            # Match BeautifulSoup, which leaves script/style out of get_text()
+            entry_div.strip_tags(["script", "style"])
+            entry_text = entry_div.text()
+
+        yield (
+            link_elem.text(strip=True),
+            link_elem.attributes["href"],
+            date_text,
+            image,
+            entry_text,
+        )
 
-            # Extract all the details from the text
-            entry_text = entry_div.get_text()
 
-            # Extract Artist
-            artist_match = re.search(r"Artist:\s*([^\n]+)", entry_text)
-            if artist_match:
-                album["artist"] = artist_match.group(1).strip()
+def parse_newalbumreleases_metal(html_content: str, url: str) -> list[dict]:
+    """
+    Parse New Album Releases metal category.
 
-            # Extract Album name
-            album_match = re.search(r"Album:\s*([^\n]+)", entry_text)
-            if album_match:
-                album["album_name"] = album_match.group(1).strip()
+    Args:
+        html_content: HTML content of the page
+        url: Base URL for resolving relative links
 
-            # Extract Released year
-            released_match = re.search(r"Released:\s*([^\n]+)", entry_text)
-            if released_match:
-                album["released"] = released_match.group(1).strip()
+    Returns:
+        List of article dictionaries
+    """
+    albums = []
+    # Fallback date for entries without one, computed once per page
+    today = datetime.now().strftime("%Y-%m-%d")
+    seen_links = set()
 
-            # Extract Style/Genre
-            style_match = re.search(r"Style:\s*([^\n]+)", entry_text)
-            if style_match:
-                album["style"] = style_match.group(1).strip()
+    # Find all album entries
+    entries = _album_entries_fast if _FAST else _album_entries_soup
 
-            # Extract Format
-            format_match = re.search(r"Format:\s*([^\n]+)", entry_text)
-            if format_match:
-                album["format"] = format_match.group(1).strip()
+    for title, link, date_text, image, entry_text in entries(html_content):
+        # Skip duplicates
+        if link in seen_links:
+            continue
+        seen_links.add(link)
+
+        album = {"title": title, "link": link}
 
-            # Extract Size
-            size_match = re.search(r"Size:\s*([^\n]+)", entry_text)
-            if size_match:
-                album["size"] = size_match.group(1).strip()
+        # Extract date from the clock span, format: " On September - 29 - 2025"
+        date_match = _DATE_ON.search(date_text) if date_text else None
+        if date_match:
+            month_name = date_match.group(1)
+            day = date_match.group(2).zfill(2)
+            year = date_match.group(3)
+
+            month = f"{_MONTH_INDEX.get(month_name, 1):02d}"
+            album["date"] = f"{year}-{month}-{day}"
+        else:
+            album["date"] = today
+
+        # Extract album details from the entry div
+        if entry_text is not None:
+            if image:
+                album["image"] = image
+
+            # Extract Artist, Album, Released, Style, Format and Size in a
+            # single pass, keeping the first occurrence of each field
+            for field_match in _ENTRY_FIELDS.finditer(entry_text):
+                album.setdefault(
+                    _ENTRY_FIELD_KEYS[field_match.group(1)],
+                    field_match.group(2).strip(),
+                )
 
             # Build rich HTML description with all info
             description_parts = []
@@ -449,18 +707,22 @@ def get_parser(parser_name: str):
     return PARSERS.get(parser_name)
 
 
-def extract_immich_content(html_content: str) -> Optional[str]:
+def extract_immich_content(
+    html_content: str, soup: Optional[BeautifulSoup] = None
+) -> Optional[str]:
     """
     Extract full article content from an Immich blog post page.
 
     Args:
         html_content: HTML content of the article page
+        soup: Already parsed html_content, to avoid parsing the page again
 
     Returns:
         Article content as HTML string, or None if extraction fails
     """
     try:
-        soup = BeautifulSoup(html_content, "html.parser")
+        if soup is None:
+            soup = parse_html(html_content)
 
         # Immich uses a specific structure: find h1, then go up to container
         h1 = soup.find("h1")
@@ -490,12 +752,15 @@ def extract_immich_content(html_content: str) -> Optional[str]:
         return None
 
 
-def extract_immich_metadata(html_content: str) -> dict:
+def extract_immich_metadata(
+    html_content: str, soup: Optional[BeautifulSoup] = None
+) -> dict:
     """
     Extract metadata (author, image) from Immich blog post.
 
     Args:
         html_content: HTML content of the article page
+        soup: Already parsed html_content, to avoid parsing the page again
 
     Returns:
         Dictionary with 'author' and 'image' keys
@@ -503,7 +768,8 @@ def extract_immich_metadata(html_content: str) -> dict:
     metadata = {"author": None, "image": None}
 
     try:
-        soup = BeautifulSoup(html_content, "html.parser")
+        if soup is None:
+            soup = parse_html(html_content)
 
         # Extract author - look for text after "—"
         for p in soup.find_all("p"):
@@ -533,28 +799,28 @@ def extract_immich_metadata(html_content: str) -> dict:
     return metadata
 
 
-def extract_diariodominho_content(html_content: str) -> Optional[str]:
+def extract_diariodominho_content(
+    html_content: str, soup: Optional[BeautifulSoup] = None
+) -> Optional[str]:
     """
     Extract full article content from a Diário do Minho article page.
 
     Args:
         html_content: HTML content of the article page
+        soup: Already parsed html_content, to avoid parsing the page again
 
     Returns:
         Article content as HTML string, or None if extraction fails
     """
     try:
-        soup = BeautifulSoup(html_content, "html.parser")
+        if soup is None:
+            soup = parse_html(html_content)
 
         # Look for article content
         article = soup.find("article")
         if not article:
             # Try finding by class patterns
-            article = soup.find(
-                ["div", "section"],
-                class_=lambda x: x
-                and ("article" in x.lower() or "content" in x.lower()),
-            )
+            article = soup.find(["div", "section"], class_=_ARTICLE_CLASS)
 
         if article:
             article_html = str(article)
@@ -569,12 +835,15 @@ def extract_diariodominho_content(html_content: str) -> Optional[str]:
         return None
 
 
-def extract_diariodominho_metadata(html_content: str) -> dict:
+def extract_diariodominho_metadata(
+    html_content: str, soup: Optional[BeautifulSoup] = None
+) -> dict:
     """
     Extract metadata (author, image) from Diário do Minho article.
 
     Args:
         html_content: HTML content of the article page
+        soup: Already parsed html_content, to avoid parsing the page again
 
     Returns:
         Dictionary with 'author' and 'image' keys
@@ -582,12 +851,11 @@ def extract_diariodominho_metadata(html_content: str) -> dict:
     metadata = {"author": None, "image": None}
 
     try:
-        soup = BeautifulSoup(html_content, "html.parser")
+        if soup is None:
+            soup = parse_html(html_content)
 
         # Extract author - look for byline or author meta
-        author_elem = soup.find(
-            ["span", "div", "p"], class_=lambda x: x and "author" in x.lower()
-        )
+        author_elem = soup.find(["span", "div", "p"], class_=_AUTHOR_CLASS)
         if author_elem:
             metadata["author"] = author_elem.get_text(strip=True)
 
@@ -11,6 +11,7 @@ SITES = {
         "description": "Latest posts from the Immich blog",
         "email": "noreply@immich.app",
         "wait_time": 2000,
+        "ready_selector": 'a[href*="/blog/"]',
         "max_articles": 10,  # Limit to most recent articles
     },
     "diariodominho": {
@@ -23,6 +24,7 @@ SITES = {
         "description": "Últimas notícias do Diário do Minho",
         "email": "noreply@diariodominho.pt",
         "wait_time": 3000,
+        "ready_selector": 'a[href*="/noticias/"]',
         "max_articles": 10,  # Limit to most recent articles
     },
     "newalbumreleases_metal": {
@@ -35,6 +37,7 @@ SITES = {
         "description": "Latest metal album releases from NewAlbumReleases.cc",
         "email": "noreply@newalbumreleases.cc",
         "wait_time": 2000,
+        "ready_selector": "div.single",
         "max_articles": 20,  # Limit to most recent albums
     },
 }
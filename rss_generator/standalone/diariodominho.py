@@ -6,7 +6,8 @@ Scrapes https://www.diariodominho.pt/ and generates an RSS feed.
 
 import os
 import sys
-from datetime import datetime
+from datetime import datetime, timezone
+from email.utils import format_datetime
 from urllib.parse import urljoin
 import re
 
@@ -14,12 +15,15 @@ import boto3
 from bs4 import BeautifulSoup
 from botocore.exceptions import ClientError
 from dotenv import load_dotenv
-from feedgen.feed import FeedGenerator
+from lxml import etree
 from playwright.sync_api import sync_playwright
 
 # Load environment variables from .env file
 load_dotenv()
 
+# News article links, matched by find_all with re.search
+_NOTICIAS_HREF = re.compile("/noticias/")
+
 
 def fetch_news_articles(url: str) -> list[dict]:
     """
@@ -52,7 +56,7 @@ def fetch_news_articles(url: str) -> list[dict]:
     soup = BeautifulSoup(html_content, "html.parser")
 
     # Find all article links
-    articles = soup.find_all("a", href=lambda x: x and "/noticias/" in x)
+    articles = soup.find_all("a", href=_NOTICIAS_HREF)
 
     seen_links = set()
 
@@ -119,50 +123,71 @@ def fetch_news_articles(url: str) -> list[dict]:
     return articles_list
 
 
-def generate_rss_feed(articles: list[dict], output_file: str, site_url: str):
+def _render_rss(articles: list[dict], site_url: str) -> bytes:
     """
-    Generate an RSS feed from news articles.
+    Build the RSS 2.0 document for the news articles in a single pass.
 
     Args:
         articles: List of article dictionaries
-        output_file: Path to save the RSS feed
         site_url: The website URL
+
+    Returns:
+        Serialized RSS feed
     """
-    fg = FeedGenerator()
-    fg.id(site_url)
-    fg.title("Diário do Minho")
-    fg.author({"name": "Diário do Minho", "email": "noreply@diariodominho.pt"})
-    fg.link(href=site_url, rel="alternate")
-    fg.description("Últimas notícias do Diário do Minho")
-    fg.language("pt")
+    rss = etree.Element("rss", version="2.0")
+    channel = etree.SubElement(rss, "channel")
+    for tag, text in (
+        ("title", "Diário do Minho"),
+        ("link", site_url),
+        ("description", "Últimas notícias do Diário do Minho"),
+        ("language", "pt"),
+        ("managingEditor", "noreply@diariodominho.pt (Diário do Minho)"),
+        ("generator", "RSS Generator"),
+        ("lastBuildDate", format_datetime(datetime.now(timezone.utc))),
+    ):
+        etree.SubElement(channel, tag).text = text
 
     for article in articles:
-        fe = fg.add_entry()
-        fe.id(article["link"])
-        fe.title(article["title"])
-        fe.link(href=article["link"])
-        fe.description(article.get("description", article["title"]))
+        item = etree.SubElement(channel, "item")
+        etree.SubElement(item, "title").text = article["title"]
+        etree.SubElement(item, "link").text = article["link"]
+        etree.SubElement(item, "description").text = article.get(
+            "description", article["title"]
+        )
+        etree.SubElement(item, "guid", isPermaLink="false").text = article["link"]
 
         # Add category if available
         if article.get("category"):
-            fe.category(term=article["category"])
+            etree.SubElement(item, "category").text = article["category"]
 
         # Handle date parsing
-        try:
-            if isinstance(article.get("date"), str):
-                # Try to parse common date formats
-                for fmt in ["%Y-%m-%d", "%Y-%m-%dT%H:%M:%S", "%B %d, %Y", "%b %d, %Y"]:
-                    try:
-                        dt = datetime.strptime(article["date"], fmt)
-                        fe.published(dt)
-                        break
-                    except ValueError:
-                        continue
-        except Exception:
-            pass
+        if isinstance(article.get("date"), str):
+            # Try to parse common date formats
+            for fmt in ["%Y-%m-%d", "%Y-%m-%dT%H:%M:%S", "%B %d, %Y", "%b %d, %Y"]:
+                try:
+                    dt = datetime.strptime(article["date"], fmt)
+                except ValueError:
+                    continue
+                etree.SubElement(item, "pubDate").text = format_datetime(
+                    dt.replace(tzinfo=timezone.utc)
+                )
+                break
+
+    return etree.tostring(rss.getroottree(), xml_declaration=True, encoding="UTF-8")
+
 
+def generate_rss_feed(articles: list[dict], output_file: str, site_url: str):
+    """
+    Generate an RSS feed from news articles.
+
+    Args:
+        articles: List of article dictionaries
+        output_file: Path to save the RSS feed
+        site_url: The website URL
+    """
     # Write RSS feed
-    fg.rss_file(output_file)
+    with open(output_file, "wb") as f:
+        f.write(_render_rss(articles, site_url))
     print(f"RSS feed generated: {output_file}")
     print(f"Found {len(articles)} articles")
 
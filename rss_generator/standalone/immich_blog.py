@@ -5,20 +5,29 @@ Scrapes https://immich.app/blog and generates an RSS feed.
 """
 
 import os
+import re
 import sys
-from datetime import datetime
+from datetime import datetime, timezone
+from email.utils import format_datetime
 from urllib.parse import urljoin
 
 import boto3
 from bs4 import BeautifulSoup
 from botocore.exceptions import ClientError
 from dotenv import load_dotenv
-from feedgen.feed import FeedGenerator
+from lxml import etree
 from playwright.sync_api import sync_playwright
 
 # Load environment variables from .env file
 load_dotenv()
 
+# Case-insensitive class matchers, checked by find/find_all with re.search
+_POST_CLASS = re.compile("post|blog", re.IGNORECASE)
+_DATE_CLASS = re.compile("date", re.IGNORECASE)
+_EXCERPT_CLASS = re.compile("excerpt|description", re.IGNORECASE)
+# Blog post links, excluding the blog index itself
+_BLOG_POST_HREF = re.compile(r"\A(?!/blog/\Z).*/blog/", re.DOTALL)
+
 
 def fetch_blog_posts(url: str) -> list[dict]:
     """
@@ -51,16 +60,11 @@ def fetch_blog_posts(url: str) -> list[dict]:
     soup = BeautifulSoup(html_content, "html.parser")
 
     # Try to find blog post articles
-    articles = soup.find_all(
-        ["article", "div"],
-        class_=lambda x: x and ("post" in x.lower() or "blog" in x.lower()),
-    )
+    articles = soup.find_all(["article", "div"], class_=_POST_CLASS)
 
     if not articles:
         # Fallback: look for links that might be blog posts
-        articles = soup.find_all(
-            "a", href=lambda x: x and "/blog/" in x and x != "/blog" and x != "/blog/"
-        )
+        articles = soup.find_all("a", href=_BLOG_POST_HREF)
 
     for article in articles:
         post = {}
@@ -82,9 +86,7 @@ def fetch_blog_posts(url: str) -> list[dict]:
             continue
 
         # Extract date
-        date_elem = article.find(
-            ["time", "span", "div"], class_=lambda x: x and "date" in x.lower()
-        )
+        date_elem = article.find(["time", "span", "div"], class_=_DATE_CLASS)
         if date_elem:
             date_text = date_elem.get("datetime") or date_elem.get_text(strip=True)
             post["date"] = date_text
@@ -92,11 +94,7 @@ def fetch_blog_posts(url: str) -> list[dict]:
             post["date"] = datetime.now().isoformat()
 
         # Extract description/excerpt
-        desc_elem = article.find(
-            ["p", "div"],
-            class_=lambda x: x
-            and ("excerpt" in x.lower() or "description" in x.lower()),
-        )
+        desc_elem = article.find(["p", "div"], class_=_EXCERPT_CLASS)
         if desc_elem:
             post["description"] = desc_elem.get_text(strip=True)
         else:
@@ -112,46 +110,67 @@ def fetch_blog_posts(url: str) -> list[dict]:
     return posts
 
 
-def generate_rss_feed(posts: list[dict], output_file: str, blog_url: str):
+def _render_rss(posts: list[dict], blog_url: str) -> bytes:
     """
-    Generate an RSS feed from blog posts.
+    Build the RSS 2.0 document for the blog posts in a single pass.
 
     Args:
         posts: List of post dictionaries
-        output_file: Path to save the RSS feed
         blog_url: The blog URL
+
+    Returns:
+        Serialized RSS feed
     """
-    fg = FeedGenerator()
-    fg.id(blog_url)
-    fg.title("Immich Blog")
-    fg.author({"name": "Immich", "email": "noreply@immich.app"})
-    fg.link(href=blog_url, rel="alternate")
-    fg.description("Latest posts from the Immich blog")
-    fg.language("en")
+    rss = etree.Element("rss", version="2.0")
+    channel = etree.SubElement(rss, "channel")
+    for tag, text in (
+        ("title", "Immich Blog"),
+        ("link", blog_url),
+        ("description", "Latest posts from the Immich blog"),
+        ("language", "en"),
+        ("managingEditor", "noreply@immich.app (Immich)"),
+        ("generator", "RSS Generator"),
+        ("lastBuildDate", format_datetime(datetime.now(timezone.utc))),
+    ):
+        etree.SubElement(channel, tag).text = text
 
     for post in posts:
-        fe = fg.add_entry()
-        fe.id(post["link"])
-        fe.title(post["title"])
-        fe.link(href=post["link"])
-        fe.description(post.get("description", post["title"]))
+        item = etree.SubElement(channel, "item")
+        etree.SubElement(item, "title").text = post["title"]
+        etree.SubElement(item, "link").text = post["link"]
+        etree.SubElement(item, "description").text = post.get(
+            "description", post["title"]
+        )
+        etree.SubElement(item, "guid", isPermaLink="false").text = post["link"]
 
         # Handle date parsing
-        try:
-            if isinstance(post.get("date"), str):
-                # Try to parse common date formats
-                for fmt in ["%Y-%m-%dT%H:%M:%S", "%Y-%m-%d", "%B %d, %Y", "%b %d, %Y"]:
-                    try:
-                        dt = datetime.strptime(post["date"], fmt)
-                        fe.published(dt)
-                        break
-                    except ValueError:
-                        continue
-        except Exception:
-            pass
+        if isinstance(post.get("date"), str):
+            # Try to parse common date formats
+            for fmt in ["%Y-%m-%dT%H:%M:%S", "%Y-%m-%d", "%B %d, %Y", "%b %d, %Y"]:
+                try:
+                    dt = datetime.strptime(post["date"], fmt)
+                except ValueError:
+                    continue
+                etree.SubElement(item, "pubDate").text = format_datetime(
+                    dt.replace(tzinfo=timezone.utc)
+                )
+                break
 
+    return etree.tostring(rss.getroottree(), xml_declaration=True, encoding="UTF-8")
+
+
+def generate_rss_feed(posts: list[dict], output_file: str, blog_url: str):
+    """
+    Generate an RSS feed from blog posts.
+
+    Args:
+        posts: List of post dictionaries
+        output_file: Path to save the RSS feed
+        blog_url: The blog URL
+    """
     # Write RSS feed
-    fg.rss_file(output_file)
+    with open(output_file, "wb") as f:
+        f.write(_render_rss(posts, blog_url))
     print(f"RSS feed generated: {output_file}")
     print(f"Found {len(posts)} blog posts")
 
@@ -1,7 +1,85 @@
 """Pytest configuration and shared fixtures."""
 
+from unittest.mock import AsyncMock, MagicMock
+
 import pytest
 
+from rss_generator.common import PlaywrightSession, _get_s3_client
+
+
+@pytest.fixture(autouse=True)
+def clear_s3_client_cache():
+    """Drop the cached S3 client so each test sees its own boto3 mock."""
+    _get_s3_client.cache_clear()
+    yield
+    _get_s3_client.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def playwright_session(monkeypatch):
+    """Swap in a fresh browser session so tests never share one."""
+    session = PlaywrightSession()
+    monkeypatch.setattr("rss_generator.common.playwright_session", session)
+    yield session
+    session.shutdown()
+
+
+@pytest.fixture
+def mock_browser(monkeypatch):
+    """Mock the async Playwright driver and browser used by PlaywrightSession.
+
+    Map URLs to HTML in mock_browser.pages; an Exception value makes that page
+    load fail. Every browser context created is recorded in
+    mock_browser.contexts, and the driver is available as mock_browser.driver.
+    """
+    browser = MagicMock()
+    browser.pages = {}
+    browser.contexts = []
+    browser.close = AsyncMock()
+
+    def new_context():
+        loaded = {}
+
+        async def goto(url, **kwargs):
+            loaded["url"] = url
+            result = browser.pages.get(url, "")
+            if isinstance(result, Exception):
+                raise result
+
+        page = MagicMock()
+        page.goto = AsyncMock(side_effect=goto)
+        page.wait_for_selector = AsyncMock()
+        page.wait_for_timeout = AsyncMock()
+        page.content = AsyncMock(side_effect=lambda: browser.pages[loaded["url"]])
+        context = MagicMock()
+        context.page = page
+        context.new_page = AsyncMock(return_value=page)
+        context.route = AsyncMock()
+        context.close = AsyncMock()
+        browser.contexts.append(context)
+        return context
+
+    browser.new_context = AsyncMock(side_effect=new_context)
+
+    driver = MagicMock()
+    driver.chromium.launch = AsyncMock(return_value=browser)
+    driver.stop = AsyncMock()
+    browser.driver = driver
+
+    async_playwright = MagicMock()
+    async_playwright.return_value.start = AsyncMock(return_value=driver)
+    monkeypatch.setattr("rss_generator.common.async_playwright", async_playwright)
+    return browser
+
+
+@pytest.fixture(params=[False, True], ids=["soup", "selectolax"])
+def parser_backend(request, monkeypatch):
+    """Run listing parser tests against both HTML backends."""
+    if request.param:
+        pytest.importorskip("selectolax.lexbor")
+    monkeypatch.setattr("rss_generator.parsers._FAST", request.param)
+    return request.param
+
 
 @pytest.fixture
 def sample_immich_html():
@@ -1,10 +1,12 @@
 """Tests for CLI module."""
 
+import asyncio
 from unittest.mock import Mock, patch
 
 from typer.testing import CliRunner
 
 from rss_generator.cli import app, process_site
+from rss_generator.sites import get_site_config, list_sites
 
 
 runner = CliRunner()
@@ -115,16 +117,89 @@ class TestGenerateCommand:
         # Should not upload when --no-upload is specified
         mock_upload.assert_not_called()
 
+    @patch("rss_generator.cli.fetch_all")
     @patch("rss_generator.cli.process_site")
-    def test_generate_all_flag(self, mock_process):
+    def test_generate_all_flag(self, mock_process, mock_fetch_all):
         """Test generate command with --all flag."""
         mock_process.return_value = True
+        mock_fetch_all.side_effect = lambda urls: ["<html>Test</html>"] * len(urls)
 
         runner.invoke(app, ["generate", "--all"])
 
         # Should call process_site for each configured site
         assert mock_process.call_count >= 2  # At least immich and diariodominho
 
+        # Site pages are fetched once, concurrently, and handed to process_site
+        mock_fetch_all.assert_called_once()
+        assert mock_process.call_args[1]["html_content"] == "<html>Test</html>"
+
+    @patch("rss_generator.cli.fetch_all")
+    @patch("rss_generator.cli.process_site")
+    @patch("rss_generator.cli.upload_many_to_minio")
+    def test_generate_all_uploads_feeds_together(
+        self, mock_upload_many, mock_process, mock_fetch_all, tmp_path, monkeypatch
+    ):
+        """Test that --all queues feed uploads and uploads them in one batch."""
+        monkeypatch.chdir(tmp_path)
+        mock_fetch_all.side_effect = lambda urls: ["<html>Test</html>"] * len(urls)
+
+        def queue_upload(site_id, **kwargs):
+            output_file = get_site_config(site_id)["output_file"]
+            kwargs["pending_uploads"].append((output_file, "test-bucket", None))
+            return True
+
+        mock_process.side_effect = queue_upload
+        mock_upload_many.side_effect = lambda items: [True] * len(items)
+
+        result = runner.invoke(app, ["generate", "--all"])
+
+        assert result.exit_code == 0
+        mock_upload_many.assert_called_once()
+        items = mock_upload_many.call_args[0][0]
+        # One feed per site plus the XSL stylesheet for the bucket
+        assert len(items) == len(list_sites()) + 1
+        assert any(item[2] == "feed.xsl" for item in items)
+
+    @patch("rss_generator.cli.fetch_all")
+    @patch("rss_generator.cli.process_site")
+    @patch("rss_generator.cli.upload_many_to_minio")
+    def test_generate_all_fails_when_upload_fails(
+        self, mock_upload_many, mock_process, mock_fetch_all, tmp_path, monkeypatch
+    ):
+        """Test that a failed batch upload marks the site as failed."""
+        monkeypatch.chdir(tmp_path)
+        mock_fetch_all.side_effect = lambda urls: ["<html>Test</html>"] * len(urls)
+
+        def queue_upload(site_id, **kwargs):
+            output_file = get_site_config(site_id)["output_file"]
+            kwargs["pending_uploads"].append((output_file, "test-bucket", None))
+            return True
+
+        mock_process.side_effect = queue_upload
+        mock_upload_many.side_effect = lambda items: [False] + [True] * (
+            len(items) - 1
+        )
+
+        result = runner.invoke(app, ["generate", "--all"])
+
+        assert result.exit_code == 1
+        assert list_sites()[0] in result.stdout
+
+    @patch("rss_generator.cli.fetch_page_with_playwright")
+    @patch("rss_generator.cli.fetch_all")
+    def test_generate_all_does_not_refetch_failed_pages(
+        self, mock_fetch_all, mock_fetch, tmp_path, monkeypatch
+    ):
+        """Test that site pages that failed in the batch are not fetched again."""
+        monkeypatch.chdir(tmp_path)
+        mock_fetch_all.side_effect = lambda urls: [None] * len(urls)
+
+        result = runner.invoke(app, ["generate", "--all", "--no-upload"])
+
+        assert result.exit_code == 1
+        mock_fetch_all.assert_called_once()
+        mock_fetch.assert_not_called()
+
     def test_generate_with_custom_bucket(self):
         """Test generate command with custom bucket."""
         with patch("rss_generator.cli.process_site") as mock_process:
@@ -240,10 +315,13 @@ class TestProcessSite:
         result = process_site("immich", upload=False)
         assert result is False
 
+    @patch("rss_generator.cli.fetch_all", return_value=[])
     @patch("rss_generator.cli.fetch_page_with_playwright")
     @patch("rss_generator.cli.get_parser")
     @patch("rss_generator.cli.generate_rss_feed")
-    def test_process_site_limits_articles(self, mock_generate, mock_parser, mock_fetch):
+    def test_process_site_limits_articles(
+        self, mock_generate, mock_parser, mock_fetch, mock_fetch_all
+    ):
         """Test that process_site respects max_articles limit."""
         mock_fetch.return_value = "<html>Test</html>"
 
@@ -264,13 +342,20 @@ class TestProcessSite:
         articles_passed = call_args[0]
         assert len(articles_passed) <= 10
 
+    @patch("rss_generator.cli.fetch_all", return_value=[])
     @patch("rss_generator.cli.fetch_page_with_playwright")
     @patch("rss_generator.cli.get_parser")
     @patch("rss_generator.cli.generate_rss_feed")
     @patch("rss_generator.cli.check_minio_credentials")
     @patch("rss_generator.cli.upload_to_minio")
     def test_process_site_uploads_when_requested(
-        self, mock_upload, mock_check, mock_generate, mock_parser, mock_fetch
+        self,
+        mock_upload,
+        mock_check,
+        mock_generate,
+        mock_parser,
+        mock_fetch,
+        mock_fetch_all,
     ):
         """Test that process_site uploads when upload=True and credentials exist."""
         mock_fetch.return_value = "<html>Test</html>"
@@ -287,12 +372,13 @@ class TestProcessSite:
         # Should upload both RSS and XSL
         assert mock_upload.call_count >= 1
 
+    @patch("rss_generator.cli.fetch_all", return_value=[])
     @patch("rss_generator.cli.fetch_page_with_playwright")
     @patch("rss_generator.cli.get_parser")
     @patch("rss_generator.cli.generate_rss_feed")
     @patch("rss_generator.cli.check_minio_credentials")
     def test_process_site_skips_upload_without_credentials(
-        self, mock_check, mock_generate, mock_parser, mock_fetch
+        self, mock_check, mock_generate, mock_parser, mock_fetch, mock_fetch_all
     ):
         """Test that process_site skips upload when credentials are missing."""
         mock_fetch.return_value = "<html>Test</html>"
@@ -306,3 +392,99 @@ class TestProcessSite:
 
         # Should still succeed even without upload
         assert result is True
+
+    @patch("rss_generator.cli.fetch_page_with_playwright")
+    @patch("rss_generator.cli.fetch_all")
+    @patch("rss_generator.cli.get_parser")
+    @patch("rss_generator.cli.get_content_extractor")
+    @patch("rss_generator.cli.get_metadata_extractor")
+    @patch("rss_generator.cli.generate_rss_feed")
+    def test_process_site_fetches_articles_concurrently(
+        self,
+        mock_generate,
+        mock_metadata,
+        mock_content,
+        mock_parser,
+        mock_fetch_all,
+        mock_fetch,
+    ):
+        """Test that article pages are fetched in one concurrent batch."""
+        mock_fetch.return_value = "<html>Test</html>"
+        articles = [
+            {"title": f"Article {i}", "link": f"http://example.com/{i}"}
+            for i in range(3)
+        ]
+        mock_parser.return_value = Mock(return_value=articles)
+        mock_fetch_all.return_value = ["<p>1</p>", None, "<p>3</p>"]
+        mock_content.return_value = Mock(side_effect=lambda html, soup: html)
+        mock_metadata.return_value = None
+        mock_generate.return_value = True
+
+        assert process_site("immich", upload=False) is True
+
+        mock_fetch_all.assert_called_once()
+        assert len(mock_fetch_all.call_args[0][0]) == 3
+        assert articles[0]["content"] == "<p>1</p>"
+        assert "content" not in articles[1]
+        assert articles[2]["content"] == "<p>3</p>"
+
+    @patch("rss_generator.cli.fetch_page_with_playwright")
+    @patch("rss_generator.cli.fetch_all")
+    @patch("rss_generator.cli.get_parser")
+    @patch("rss_generator.cli.get_content_extractor")
+    @patch("rss_generator.cli.get_metadata_extractor")
+    @patch("rss_generator.cli.generate_rss_feed")
+    def test_process_site_parses_each_article_once(
+        self,
+        mock_generate,
+        mock_metadata,
+        mock_content,
+        mock_parser,
+        mock_fetch_all,
+        mock_fetch,
+    ):
+        """Test that both extractors share one parsed tree per article."""
+        mock_fetch.return_value = "<html>Test</html>"
+        articles = [{"title": "Article", "link": "http://example.com/1"}]
+        mock_parser.return_value = Mock(return_value=articles)
+        mock_fetch_all.return_value = ["<html><h1>Title</h1></html>"]
+        content_extractor = Mock(return_value="<p>Content</p>")
+        metadata_extractor = Mock(return_value={"author": "Jane", "image": None})
+        mock_content.return_value = content_extractor
+        mock_metadata.return_value = metadata_extractor
+        mock_generate.return_value = True
+
+        assert process_site("immich", upload=False) is True
+
+        content_soup = content_extractor.call_args[0][1]
+        metadata_soup = metadata_extractor.call_args[0][1]
+        assert content_soup is metadata_soup
+        assert content_soup.h1.get_text() == "Title"
+        assert articles[0]["author"] == "Jane"
+
+    @patch("rss_generator.common.sync_playwright")
+    def test_process_site_fetches_through_one_browser(
+        self, mock_sync_playwright, mock_browser, tmp_path, monkeypatch
+    ):
+        """Test the unmocked fetch flow: one async browser, no sync Playwright."""
+        monkeypatch.chdir(tmp_path)
+        mock_sync_playwright.side_effect = AssertionError("sync Playwright API used")
+        mock_browser.pages[get_site_config("immich")["url"]] = """
+            <article class="post">
+                <h2>Post Title</h2>
+                <a href="/blog/2024-01-01-post">Read more</a>
+            </article>
+        """
+        mock_browser.pages["https://immich.app/blog/2024-01-01-post"] = (
+            "<html><body><article><p>Full post</p></article></body></html>"
+        )
+
+        assert process_site("immich", upload=False) is True
+        assert process_site("immich", upload=False) is True
+
+        # Listing and article pages of both runs share a single browser
+        mock_browser.driver.chromium.launch.assert_awaited_once()
+        assert mock_browser.new_context.await_count == 4
+        mock_sync_playwright.assert_not_called()
+        # Keeping the browser open must not leave an event loop running
+        asyncio.run(asyncio.sleep(0))
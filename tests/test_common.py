@@ -1,11 +1,17 @@
 """Tests for common utilities module."""
 
+import asyncio
 import os
 from unittest.mock import patch, MagicMock
 
 
 from rss_generator.common import (
+    BLOCKED_RESOURCE_TYPES,
+    S3_TRANSFER_CONFIG,
+    PlaywrightSession,
+    fetch_all,
     generate_rss_feed,
+    upload_many_to_minio,
     check_minio_credentials,
     check_playwright_browsers,
     upload_to_minio,
@@ -90,6 +96,25 @@ class TestGenerateRssFeed:
             content = f.read()
             assert xsl_url in content
 
+    def test_xsl_stylesheet_precedes_root(
+        self, sample_articles, sample_site_config, temp_output_file
+    ):
+        """Test that the stylesheet is a processing instruction before <rss>."""
+        from lxml import etree
+
+        xsl_url = "https://example.com/feed.xsl"
+        generate_rss_feed(
+            sample_articles, temp_output_file, sample_site_config, xsl_url=xsl_url
+        )
+
+        root = etree.parse(temp_output_file).getroot()
+        stylesheet = root.getprevious()
+        assert root.tag == "rss"
+        assert isinstance(stylesheet, etree._ProcessingInstruction)
+        assert stylesheet.target == "xml-stylesheet"
+        assert stylesheet.get("href") == xsl_url
+        assert stylesheet.get("type") == "text/xsl"
+
     def test_generates_xsl_url_from_bucket(
         self, sample_articles, sample_site_config, temp_output_file, mock_env_vars
     ):
@@ -126,6 +151,39 @@ class TestGenerateRssFeed:
         result = generate_rss_feed(articles, temp_output_file, sample_site_config)
         assert result is True
 
+    def test_formats_pub_dates(self, sample_site_config, temp_output_file):
+        """Test that every supported date format yields the same pubDate."""
+        dates = [
+            "2023-12-30",
+            "2023-12-30T00:00:00",
+            "December 30, 2023",
+            "Dec 30, 2023",
+        ]
+        articles = [
+            {"title": f"Test {i}", "link": f"http://example.com/{i}", "date": date}
+            for i, date in enumerate(dates)
+        ]
+
+        generate_rss_feed(articles, temp_output_file, sample_site_config)
+
+        with open(temp_output_file, "r") as f:
+            content = f.read()
+            assert (
+                content.count("<pubDate>Sat, 30 Dec 2023 00:00:00 +0000</pubDate>") == 4
+            )
+
+    def test_skips_unparseable_dates(self, sample_site_config, temp_output_file):
+        """Test that unrecognised dates are left out instead of failing."""
+        articles = [
+            {"title": "Test", "link": "http://example.com/1", "date": "yesterday"},
+        ]
+
+        result = generate_rss_feed(articles, temp_output_file, sample_site_config)
+
+        assert result is True
+        with open(temp_output_file, "r") as f:
+            assert "<pubDate>" not in f.read()
+
     def test_handles_missing_dates(self, sample_site_config, temp_output_file):
         """Test handling of articles without dates."""
         articles = [
@@ -135,6 +193,15 @@ class TestGenerateRssFeed:
         result = generate_rss_feed(articles, temp_output_file, sample_site_config)
         assert result is True
 
+    def test_writes_utf8(self, sample_site_config, temp_output_file):
+        """Test that non-ASCII text is written as UTF-8."""
+        articles = [{"title": "Notícias do Diário", "link": "http://example.com/1"}]
+
+        generate_rss_feed(articles, temp_output_file, sample_site_config)
+
+        with open(temp_output_file, "rb") as f:
+            assert "Notícias do Diário".encode("utf-8") in f.read()
+
     def test_handles_empty_articles_list(self, sample_site_config, temp_output_file):
         """Test handling of empty articles list."""
         result = generate_rss_feed([], temp_output_file, sample_site_config)
@@ -300,6 +367,34 @@ class TestUploadToMinio:
         assert "endpoint_url" in call_kwargs
         assert call_kwargs["endpoint_url"] == "https://s3.example.com"
 
+    @patch("rss_generator.common.boto3.client")
+    def test_reuses_client_across_uploads(
+        self, mock_boto_client, temp_output_file, mock_env_vars
+    ):
+        """Test that one S3 client is shared by consecutive uploads."""
+        with open(temp_output_file, "w") as f:
+            f.write("test content")
+
+        upload_to_minio(temp_output_file, "test-bucket")
+        upload_to_minio(temp_output_file, "test-bucket", "other.xml")
+
+        mock_boto_client.assert_called_once()
+        assert mock_boto_client.return_value.upload_file.call_count == 2
+
+    @patch("rss_generator.common.boto3.client")
+    def test_uses_multipart_transfer_config(
+        self, mock_boto_client, temp_output_file, mock_env_vars
+    ):
+        """Test that uploads use the threaded multipart transfer config."""
+        with open(temp_output_file, "w") as f:
+            f.write("test content")
+
+        upload_to_minio(temp_output_file, "test-bucket")
+
+        call_kwargs = mock_boto_client.return_value.upload_file.call_args[1]
+        assert call_kwargs["Config"] is S3_TRANSFER_CONFIG
+        assert call_kwargs["Config"].use_threads is True
+
     @patch("rss_generator.common.boto3.client")
     def test_sets_correct_content_type(
         self, mock_boto_client, temp_output_file, mock_env_vars
@@ -319,6 +414,75 @@ class TestUploadToMinio:
         assert extra_args["ContentType"] == "application/rss+xml"
 
 
+class TestUploadManyToMinio:
+    """Tests for upload_many_to_minio function."""
+
+    @patch("rss_generator.common.boto3.client")
+    def test_uploads_all_items_with_one_client(
+        self, mock_boto_client, tmp_path, mock_env_vars
+    ):
+        """Test that every item is uploaded through a single shared client."""
+        items = []
+        for name in ("a.xml", "b.xml", "c.xml"):
+            path = tmp_path / name
+            path.write_text("test content")
+            items.append((str(path), "test-bucket", None))
+
+        results = upload_many_to_minio(items)
+
+        assert results == [True, True, True]
+        mock_boto_client.assert_called_once()
+        uploaded = {
+            call[0][2]
+            for call in mock_boto_client.return_value.upload_file.call_args_list
+        }
+        assert uploaded == {"a.xml", "b.xml", "c.xml"}
+
+    @patch("rss_generator.common.boto3.client")
+    def test_reports_failures_per_item(self, mock_boto_client, mock_env_vars):
+        """Test that a failed upload only marks its own item as failed."""
+        from boto3.exceptions import S3UploadFailedError
+        from botocore.exceptions import EndpointConnectionError
+
+        def upload_file(file_path, bucket_name, object_name, **kwargs):
+            # boto3 wraps S3 errors raised during the transfer like this
+            if object_name == "bad.xml":
+                raise S3UploadFailedError(
+                    "Failed to upload bad.xml to test-bucket/bad.xml: An error "
+                    "occurred (NoSuchBucket) when calling the PutObject operation"
+                )
+            if object_name == "missing.xml":
+                raise FileNotFoundError(file_path)
+            if object_name == "offline.xml":
+                raise EndpointConnectionError(endpoint_url="http://localhost:9000")
+
+        mock_boto_client.return_value.upload_file.side_effect = upload_file
+
+        results = upload_many_to_minio(
+            [
+                ("good.xml", "test-bucket", None),
+                ("bad.xml", "test-bucket", None),
+                ("missing.xml", "test-bucket", None),
+                ("offline.xml", "test-bucket", None),
+            ]
+        )
+
+        assert results == [True, False, False, False]
+
+    def test_returns_false_without_credentials(self, monkeypatch):
+        """Test that all items fail gracefully without credentials."""
+        monkeypatch.delenv("S3_ACCESS_KEY", raising=False)
+        monkeypatch.delenv("S3_SECRET_KEY", raising=False)
+        monkeypatch.delenv("MINIO_ACCESS_KEY", raising=False)
+        monkeypatch.delenv("MINIO_SECRET_KEY", raising=False)
+
+        assert upload_many_to_minio([("a.xml", "test-bucket", None)]) == [False]
+
+    def test_empty_list(self):
+        """Test that nothing is uploaded for an empty list."""
+        assert upload_many_to_minio([]) == []
+
+
 class TestFetchPageWithPlaywright:
     """Tests for fetch_page_with_playwright function.
 
@@ -327,32 +491,216 @@ class TestFetchPageWithPlaywright:
     comprehensive testing of this functionality.
     """
 
-    @patch("rss_generator.common.sync_playwright")
-    def test_returns_html_content(self, mock_playwright):
+    def test_returns_html_content(self, mock_browser):
         """Test that function returns HTML content."""
         from rss_generator.common import fetch_page_with_playwright
 
-        # Mock the playwright context manager and browser
-        mock_p = MagicMock()
-        mock_browser = MagicMock()
-        mock_page = MagicMock()
-        mock_page.content.return_value = "<html>Test content</html>"
-        mock_browser.new_page.return_value = mock_page
-        mock_p.chromium.launch.return_value = mock_browser
-        mock_playwright.return_value.__enter__.return_value = mock_p
+        mock_browser.pages["https://example.com"] = "<html>Test content</html>"
 
         result = fetch_page_with_playwright("https://example.com")
 
         assert result == "<html>Test content</html>"
-        mock_page.goto.assert_called_once()
-        mock_browser.close.assert_called_once()
+        (context,) = mock_browser.contexts
+        context.page.goto.assert_awaited_once()
+        context.close.assert_awaited_once()
+        mock_browser.close.assert_not_awaited()
 
-    @patch("rss_generator.common.sync_playwright")
-    def test_returns_none_on_error(self, mock_playwright):
+    def test_returns_none_on_error(self, mock_browser):
         """Test that function returns None on error."""
         from rss_generator.common import fetch_page_with_playwright
 
-        mock_playwright.side_effect = Exception("Network error")
+        mock_browser.pages["https://example.com"] = Exception("Network error")
+
+        result = fetch_page_with_playwright("https://example.com")
+        assert result is None
+
+    def test_returns_none_when_launch_fails(self, mock_browser):
+        """Test that a browser launch failure returns None and stops the driver."""
+        from rss_generator.common import fetch_page_with_playwright
+
+        mock_browser.driver.chromium.launch.side_effect = Exception(
+            "Executable doesn't exist"
+        )
 
         result = fetch_page_with_playwright("https://example.com")
+
         assert result is None
+        mock_browser.driver.stop.assert_awaited_once()
+
+
+class TestPlaywrightSession:
+    """Tests for the shared PlaywrightSession browser."""
+
+    def test_launches_browser_once(self, mock_browser, playwright_session):
+        """Test that single fetches and batches reuse one browser."""
+        mock_browser.pages.update(
+            {f"https://example.com/{i}": f"<p>{i}</p>" for i in range(3)}
+        )
+
+        playwright_session.fetch("https://example.com/0")
+        playwright_session.fetch_many(
+            [
+                ("https://example.com/1", 0, None, ()),
+                ("https://example.com/2", 0, None, ()),
+            ]
+        )
+
+        mock_browser.driver.chromium.launch.assert_awaited_once()
+        assert mock_browser.new_context.await_count == 3
+
+    def test_shutdown_closes_browser(self, mock_browser, playwright_session):
+        """Test that shutdown closes the browser and stops Playwright."""
+        mock_browser.pages["https://example.com"] = "<p>Test</p>"
+        playwright_session.fetch("https://example.com")
+
+        playwright_session.shutdown()
+
+        mock_browser.close.assert_awaited_once()
+        mock_browser.driver.stop.assert_awaited_once()
+
+    def test_leaves_no_running_event_loop(self, mock_browser, playwright_session):
+        """Test that asyncio.run still works while the browser is kept open."""
+        mock_browser.pages["https://example.com"] = "<p>Test</p>"
+        playwright_session.fetch("https://example.com")
+
+        asyncio.run(asyncio.sleep(0))
+
+    def test_waits_for_ready_selector(self, mock_browser, playwright_session):
+        """Test that a ready selector replaces the networkidle + fixed wait."""
+        mock_browser.pages["https://example.com"] = "<p>Test</p>"
+
+        playwright_session.fetch("https://example.com", 2000, "div.single")
+
+        page = mock_browser.contexts[0].page
+        page.goto.assert_awaited_once_with(
+            "https://example.com", wait_until="domcontentloaded"
+        )
+        page.wait_for_selector.assert_awaited_once()
+        assert page.wait_for_selector.call_args[0][0] == "div.single"
+        page.wait_for_timeout.assert_not_awaited()
+
+    def test_falls_back_to_fixed_wait(self, mock_browser, playwright_session):
+        """Test that the fixed wait is used when no ready selector is given."""
+        mock_browser.pages["https://example.com"] = "<p>Test</p>"
+
+        playwright_session.fetch("https://example.com", 2000)
+
+        page = mock_browser.contexts[0].page
+        page.goto.assert_awaited_once_with(
+            "https://example.com", wait_until="networkidle"
+        )
+        page.wait_for_timeout.assert_awaited_once_with(2000)
+        page.wait_for_selector.assert_not_awaited()
+
+    def test_blocks_unneeded_resources(self, mock_browser, playwright_session):
+        """Test that images, fonts and the like are aborted by default."""
+        mock_browser.pages["https://example.com"] = "<p>Test</p>"
+
+        playwright_session.fetch("https://example.com")
+
+        context = mock_browser.contexts[0]
+        context.route.assert_awaited_once()
+        pattern, handler = context.route.call_args[0]
+        assert pattern == "**/*"
+
+        image_route = MagicMock()
+        image_route.request.resource_type = "image"
+        handler(image_route)
+        image_route.abort.assert_called_once()
+        image_route.continue_.assert_not_called()
+
+        document_route = MagicMock()
+        document_route.request.resource_type = "document"
+        handler(document_route)
+        document_route.continue_.assert_called_once()
+        document_route.abort.assert_not_called()
+
+    def test_blocking_can_be_disabled(self, mock_browser, playwright_session):
+        """Test that an empty block list loads every resource."""
+        mock_browser.pages["https://example.com"] = "<p>Test</p>"
+
+        playwright_session.fetch("https://example.com", block_resources=())
+
+        mock_browser.contexts[0].route.assert_not_awaited()
+
+    def test_shutdown_without_fetch_is_noop(self):
+        """Test that shutdown is safe when the browser was never started."""
+        PlaywrightSession().shutdown()
+
+
+class TestFetchAll:
+    """Tests for concurrent page fetching with the shared browser session."""
+
+    def test_returns_pages_in_order(self, mock_browser):
+        """Test that pages are returned in the same order as the URLs."""
+        mock_browser.pages.update(
+            {"https://example.com/1": "<p>1</p>", "https://example.com/2": "<p>2</p>"}
+        )
+
+        result = fetch_all(
+            [
+                ("https://example.com/1", 0, None, ()),
+                ("https://example.com/2", 0, None, ()),
+            ]
+        )
+
+        assert result == ["<p>1</p>", "<p>2</p>"]
+        assert mock_browser.new_context.await_count == 2
+        mock_browser.close.assert_not_awaited()
+
+    def test_failed_page_returns_none(self, mock_browser):
+        """Test that a failing page yields None without affecting others."""
+        mock_browser.pages.update(
+            {
+                "https://example.com/1": Exception("Network error"),
+                "https://example.com/2": "<p>2</p>",
+            }
+        )
+
+        result = fetch_all(
+            [
+                ("https://example.com/1", 0, None, ()),
+                ("https://example.com/2", 0, None, ()),
+            ]
+        )
+
+        assert result == [None, "<p>2</p>"]
+
+    def test_blocks_resources_per_page(self, mock_browser):
+        """Test that request blocking is set up only for pages that ask for it."""
+        mock_browser.pages.update(
+            {"https://example.com/1": "<p>1</p>", "https://example.com/2": "<p>2</p>"}
+        )
+
+        fetch_all(
+            [
+                ("https://example.com/1", 0, None, BLOCKED_RESOURCE_TYPES),
+                ("https://example.com/2", 0, None, ()),
+            ]
+        )
+
+        blocking, plain = mock_browser.contexts
+        blocking.route.assert_awaited_once()
+        assert blocking.route.call_args[0][0] == "**/*"
+        plain.route.assert_not_awaited()
+
+    def test_launch_failure_returns_all_none(self, mock_browser):
+        """Test that a browser launch failure yields None for every URL."""
+        mock_browser.driver.chromium.launch.side_effect = Exception(
+            "Executable doesn't exist"
+        )
+
+        result = fetch_all(
+            [
+                ("https://example.com/1", 0, None, ()),
+                ("https://example.com/2", 0, None, ()),
+            ]
+        )
+
+        assert result == [None, None]
+        mock_browser.driver.chromium.launch.assert_awaited_once()
+
+    def test_empty_list(self, mock_browser):
+        """Test that no browser is started for an empty URL list."""
+        assert fetch_all([]) == []
+        mock_browser.driver.chromium.launch.assert_not_awaited()
@@ -1,5 +1,7 @@
 """Tests for parsers module."""
 
+import pytest
+
 from rss_generator.parsers import (
     clean_html_content,
     parse_immich,
@@ -12,6 +14,7 @@ from rss_generator.parsers import (
     get_parser,
     get_content_extractor,
     get_metadata_extractor,
+    parse_html,
 )
 
 
@@ -52,6 +55,32 @@ class TestCleanHtmlContent:
         assert "id=" not in cleaned
         assert "class=" in cleaned  # class is allowed
 
+    def test_removes_muted_elements(self):
+        """Test that elements with the 'muted' class are removed."""
+        html = '<div><p class="small muted">Home / Blog</p><p>Content</p></div>'
+        cleaned = clean_html_content(html)
+        assert "Home / Blog" not in cleaned
+        assert "Content" in cleaned
+
+    def test_removes_short_link_lists(self):
+        """Test that short lists of links are removed but content lists kept."""
+        html = """
+        <div>
+            <ul><li><a href="/a">Prev</a></li><li><a href="/b">Next</a></li></ul>
+            <ul><li>Plain list item without links</li></ul>
+        </div>
+        """
+        cleaned = clean_html_content(html)
+        assert "Prev" not in cleaned
+        assert "Plain list item" in cleaned
+
+    def test_does_not_wrap_fragments(self):
+        """Test that fragments are not wrapped in html/body tags."""
+        cleaned = clean_html_content("<div><p>Text</p></div>")
+        assert "<html>" not in cleaned
+        assert "<body>" not in cleaned
+        assert cleaned.startswith("<div>")
+
     def test_handles_empty_input(self):
         """Test handling of empty input."""
         assert clean_html_content("") == ""
@@ -64,6 +93,7 @@ class TestCleanHtmlContent:
         assert len(result) > 0
 
 
+@pytest.mark.usefixtures("parser_backend")
 class TestParseImmich:
     """Tests for parse_immich function."""
 
@@ -91,6 +121,56 @@ class TestParseImmich:
         if articles:
             assert articles[0]["link"].startswith("https://")
 
+    def test_matches_post_classes_case_insensitively(self):
+        """Test that post containers are matched regardless of class case."""
+        html = """
+        <div class="BlogPost">
+            <h2>Mixed Case Post</h2>
+            <a href="/blog/2024-01-01-mixed-case">Read more</a>
+            <p class="Post-Excerpt">Excerpt text</p>
+        </div>
+        """
+        articles = parse_immich(html, "https://immich.app/blog")
+        assert len(articles) == 1
+        assert articles[0]["title"] == "Mixed Case Post"
+        assert articles[0]["description"] == "Excerpt text"
+
+    def test_falls_back_to_blog_links(self):
+        """Test fallback to blog links, skipping the blog index itself."""
+        html = """
+        <a href="/blog">All posts</a>
+        <a href="/blog/2024-01-01-first-post"><h2>First Post</h2></a>
+        """
+        articles = parse_immich(html, "https://immich.app/blog")
+        assert len(articles) == 1
+        assert articles[0]["link"] == "https://immich.app/blog/2024-01-01-first-post"
+        assert articles[0]["date"] == "2024-01-01"
+
+    def test_uses_first_heading_link_time_and_paragraph(self):
+        """Test that the first matching element of each kind is used."""
+        html = """
+        <article class="post">
+            <a name="top">Anchor without href</a>
+            <p>First paragraph</p>
+            <h3>Post Title</h3>
+            <h2>Later Heading</h2>
+            <a href="/blog/post-one">Read</a>
+            <a href="/blog/other">Other</a>
+            <time datetime="2024-02-03">Feb 3</time>
+            <time datetime="2020-01-01">Old</time>
+            <p>Second paragraph</p>
+        </article>
+        """
+        articles = parse_immich(html, "https://immich.app/blog")
+        assert articles == [
+            {
+                "title": "Post Title",
+                "link": "https://immich.app/blog/post-one",
+                "date": "2024-02-03",
+                "description": "First paragraph",
+            }
+        ]
+
     def test_handles_empty_html(self):
         """Test handling of empty HTML."""
         articles = parse_immich("", "https://immich.app/blog")
@@ -103,6 +183,7 @@ class TestParseImmich:
         assert articles == []
 
 
+@pytest.mark.usefixtures("parser_backend")
 class TestParseDiariodominho:
     """Tests for parse_diariodominho function."""
 
@@ -139,12 +220,32 @@ class TestParseDiariodominho:
         articles = parse_diariodominho(html, "https://www.diariodominho.pt/")
         assert len(articles) == 1
 
+    def test_ignores_script_and_style_text(self):
+        """Test that inline script and style text is left out of titles."""
+        html = """
+        <a href="/noticias/local/2025-01-01-a">Title text <script>var x=1;</script>
+        <style>p { color: red; }</style></a>
+        """
+        articles = parse_diariodominho(html, "https://www.diariodominho.pt/")
+        assert articles[0]["title"] == "Title text"
+
+    def test_keeps_empty_paragraph_description(self):
+        """Test that an empty <p> gives an empty description, not the title."""
+        html = """
+        <a href="/noticias/local/2025-01-01-a"><h3>Article title</h3><p></p></a>
+        <a href="/noticias/local/2025-01-02-b"><h3>Without paragraph</h3></a>
+        """
+        articles = parse_diariodominho(html, "https://www.diariodominho.pt/")
+        assert articles[0]["description"] == ""
+        assert articles[1]["description"] == "Without paragraph"
+
     def test_handles_empty_html(self):
         """Test handling of empty HTML."""
         articles = parse_diariodominho("", "https://www.diariodominho.pt/")
         assert articles == []
 
 
+@pytest.mark.usefixtures("parser_backend")
 class TestParseNewAlbumReleasesMetal:
     """Tests for parse_newalbumreleases_metal function."""
 
@@ -218,6 +319,43 @@ class TestParseNewAlbumReleasesMetal:
             == "https://www.newalbumreleases.cc/pic/68a02a980ebff.jpg"
         )
 
+    def test_extracts_partial_album_details(self):
+        """Test that only the fields present in the entry are extracted."""
+        html = """
+        <div class="single">
+            <h2><a href="https://example.com/album1">Album 1</a></h2>
+            <div class="entry">
+                <p>Artist: Some Band</p>
+                <p>Size: 50 Mb</p>
+            </div>
+        </div>
+        """
+        albums = parse_newalbumreleases_metal(
+            html, "https://www.newalbumreleases.cc/category/metal/"
+        )
+        assert albums[0]["artist"] == "Some Band"
+        assert albums[0]["size"] == "50 Mb"
+        assert "album_name" not in albums[0]
+        assert "style" not in albums[0]
+
+    def test_extracts_fields_inside_other_values(self):
+        """Test that a label inside an earlier field's value is still found."""
+        html = """
+        <div class="single">
+            <h2><a href="https://example.com/album1">Album 1</a></h2>
+            <div class="entry">Artist: A<br>Album: B
+            <p>Style:
+            Released: 2025</p></div>
+        </div>
+        """
+        albums = parse_newalbumreleases_metal(
+            html, "https://www.newalbumreleases.cc/category/metal/"
+        )
+        assert albums[0]["artist"] == "AAlbum: B"
+        assert albums[0]["album_name"] == "B"
+        assert albums[0]["style"] == "Released: 2025"
+        assert albums[0]["released"] == "2025"
+
     def test_description_contains_all_info(self, sample_newalbumreleases_metal_html):
         """Test that description contains all album info and image."""
         albums = parse_newalbumreleases_metal(
@@ -306,6 +444,16 @@ class TestExtractImmichMetadata:
         assert metadata["image"] is not None
         assert "featured.jpg" in metadata["image"]
 
+    def test_accepts_parsed_soup(self, sample_article_content_html):
+        """Test that a pre-parsed tree gives the same result as raw HTML."""
+        soup = parse_html(sample_article_content_html)
+        assert extract_immich_metadata(
+            sample_article_content_html, soup
+        ) == extract_immich_metadata(sample_article_content_html)
+        assert extract_immich_content(
+            sample_article_content_html, soup
+        ) == extract_immich_content(sample_article_content_html)
+
     def test_handles_missing_metadata(self):
         """Test handling when metadata is missing."""
         html = "<html><body><p>No metadata</p></body></html>"
@@ -341,6 +489,12 @@ class TestExtractDiariodominhoMetadata:
         assert "author" in metadata
         assert "image" in metadata
 
+    def test_extracts_author(self):
+        """Test author extraction from an element with an author class."""
+        html = '<html><body><span class="Article-Author">Jane Doe</span></body></html>'
+        metadata = extract_diariodominho_metadata(html)
+        assert metadata["author"] == "Jane Doe"
+
 
 class TestParserRegistry:
     """Tests for parser registry functions."""
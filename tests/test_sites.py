@@ -1,5 +1,8 @@
 """Tests for sites configuration module."""
 
+import soupsieve
+
+from rss_generator.common import BLOCKED_RESOURCE_TYPES
 from rss_generator.sites import (
     SITES,
     get_site_config,
@@ -79,6 +82,43 @@ class TestSitesConfiguration:
                     f"Site '{site_id}' wait_time should be positive"
                 )
 
+    def test_ready_selector_is_valid_css(self):
+        """Test that ready_selector is a valid CSS selector if specified."""
+        for site_id, config in SITES.items():
+            if "ready_selector" in config:
+                # Raises SelectorSyntaxError on invalid selectors
+                assert soupsieve.compile(config["ready_selector"]), (
+                    f"Site '{site_id}' ready_selector should be valid CSS"
+                )
+
+    def test_block_resources_are_request_types(self):
+        """Test that block_resources only names Playwright resource types."""
+        resource_types = {
+            "document",
+            "stylesheet",
+            "image",
+            "media",
+            "font",
+            "script",
+            "texttrack",
+            "xhr",
+            "fetch",
+            "eventsource",
+            "websocket",
+            "manifest",
+            "other",
+        }
+        assert BLOCKED_RESOURCE_TYPES <= resource_types
+        for site_id, config in SITES.items():
+            # Sites without an override use the default set
+            blocked = config.get("block_resources", BLOCKED_RESOURCE_TYPES)
+            assert set(blocked) <= resource_types, (
+                f"Site '{site_id}' block_resources has unknown resource types"
+            )
+            assert "document" not in blocked, (
+                f"Site '{site_id}' must not block the page itself"
+            )
+
     def test_max_articles_is_positive(self):
         """Test that max_articles is positive if specified."""
         for site_id, config in SITES.items():
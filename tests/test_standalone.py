@@ -0,0 +1,159 @@
+"""Tests for the standalone feed scripts."""
+
+from email.utils import parsedate_to_datetime
+from unittest.mock import MagicMock, patch
+
+from lxml import etree
+
+from rss_generator.standalone import diariodominho, immich_blog
+
+
+class TestDiariodominhoRenderRss:
+    """Tests for the Diário do Minho standalone _render_rss function."""
+
+    def _render(self, articles):
+        xml = diariodominho._render_rss(articles, "https://www.diariodominho.pt/")
+        return etree.fromstring(xml)
+
+    def test_renders_channel_fields(self):
+        """Test that the channel metadata is written."""
+        rss = self._render([])
+        channel = rss.find("channel")
+        assert rss.get("version") == "2.0"
+        assert channel.findtext("title") == "Diário do Minho"
+        assert channel.findtext("link") == "https://www.diariodominho.pt/"
+        assert channel.findtext("description") == "Últimas notícias do Diário do Minho"
+        assert channel.findtext("language") == "pt"
+        assert (
+            channel.findtext("managingEditor")
+            == "noreply@diariodominho.pt (Diário do Minho)"
+        )
+        assert channel.findtext("generator") == "RSS Generator"
+        assert parsedate_to_datetime(channel.findtext("lastBuildDate")).tzinfo
+        assert channel.findall("item") == []
+
+    def test_renders_item_fields(self):
+        """Test that item title, link, guid, category and pubDate are written."""
+        rss = self._render(
+            [
+                {
+                    "title": "Notícia",
+                    "link": "https://www.diariodominho.pt/noticias/local/2025-10-01-a",
+                    "description": "Resumo",
+                    "category": "local",
+                    "date": "2025-10-01",
+                }
+            ]
+        )
+        item = rss.find("channel/item")
+        link = "https://www.diariodominho.pt/noticias/local/2025-10-01-a"
+        assert item.findtext("title") == "Notícia"
+        assert item.findtext("link") == link
+        assert item.findtext("description") == "Resumo"
+        assert item.find("guid").text == link
+        assert item.find("guid").get("isPermaLink") == "false"
+        assert item.findtext("category") == "local"
+        assert item.findtext("pubDate") == "Wed, 01 Oct 2025 00:00:00 +0000"
+
+    def test_omits_missing_category_and_unparseable_date(self):
+        """Test that optional fields are skipped and description defaults to title."""
+        rss = self._render(
+            [{"title": "Notícia", "link": "https://x.pt/a", "date": "ontem"}]
+        )
+        item = rss.find("channel/item")
+        assert item.findtext("description") == "Notícia"
+        assert item.find("category") is None
+        assert item.find("pubDate") is None
+
+
+def _mock_sync_playwright(html):
+    """Build a sync_playwright replacement whose page returns html."""
+    p = MagicMock()
+    page = p.chromium.launch.return_value.new_page.return_value
+    page.content.return_value = html
+    playwright = MagicMock()
+    playwright.return_value.__enter__.return_value = p
+    return playwright
+
+
+class TestImmichBlogFetchBlogPosts:
+    """Tests for the Immich blog standalone fetch_blog_posts function."""
+
+    def test_matches_classes_case_insensitively(self):
+        """Test that post, date and excerpt classes are matched in any case."""
+        html = """
+        <div class="BlogPost">
+            <h2>Mixed Case Post</h2>
+            <a href="/blog/2024-01-01-mixed-case">Read more</a>
+            <span class="PostDate">2024-01-01</span>
+            <p>First paragraph</p>
+            <p class="Post-Excerpt">Excerpt text</p>
+        </div>
+        """
+        with patch.object(immich_blog, "sync_playwright", _mock_sync_playwright(html)):
+            posts = immich_blog.fetch_blog_posts("https://immich.app/blog")
+        assert posts == [
+            {
+                "title": "Mixed Case Post",
+                "link": "https://immich.app/blog/2024-01-01-mixed-case",
+                "date": "2024-01-01",
+                "description": "Excerpt text",
+            }
+        ]
+
+    def test_falls_back_to_blog_links(self):
+        """Test fallback to blog links, skipping the blog index itself."""
+        html = """
+        <a href="/blog">All posts</a>
+        <a href="/blog/">All posts</a>
+        <a href="/blog/2024-01-01-first-post"><h2>First Post</h2></a>
+        """
+        with patch.object(immich_blog, "sync_playwright", _mock_sync_playwright(html)):
+            posts = immich_blog.fetch_blog_posts("https://immich.app/blog")
+        assert [post["link"] for post in posts] == [
+            "https://immich.app/blog/2024-01-01-first-post"
+        ]
+
+
+class TestImmichBlogRenderRss:
+    """Tests for the Immich blog standalone _render_rss function."""
+
+    def _render(self, posts):
+        return etree.fromstring(
+            immich_blog._render_rss(posts, "https://immich.app/blog")
+        )
+
+    def test_renders_channel_fields(self):
+        """Test that the channel metadata is written."""
+        channel = self._render([]).find("channel")
+        assert channel.findtext("title") == "Immich Blog"
+        assert channel.findtext("link") == "https://immich.app/blog"
+        assert channel.findtext("description") == "Latest posts from the Immich blog"
+        assert channel.findtext("language") == "en"
+        assert channel.findtext("managingEditor") == "noreply@immich.app (Immich)"
+        assert channel.findtext("generator") == "RSS Generator"
+        assert parsedate_to_datetime(channel.findtext("lastBuildDate")).tzinfo
+
+    def test_renders_item_fields(self):
+        """Test that item fields are written and each date format is parsed."""
+        link = "https://immich.app/blog/2023-12-30-version-1.0.0"
+        rss = self._render(
+            [
+                {"title": "v1.0.0", "link": link, "date": "2023-12-30T12:30:00"},
+                {
+                    "title": "Older",
+                    "link": "https://immich.app/blog/b",
+                    "date": "Jan 5, 2023",
+                },
+                {"title": "No date", "link": "https://immich.app/blog/c"},
+            ]
+        )
+        items = rss.findall("channel/item")
+        assert items[0].findtext("title") == "v1.0.0"
+        assert items[0].findtext("link") == link
+        assert items[0].find("guid").text == link
+        assert items[0].find("guid").get("isPermaLink") == "false"
+        assert items[0].find("category") is None
+        assert items[0].findtext("pubDate") == "Sat, 30 Dec 2023 12:30:00 +0000"
+        assert items[1].findtext("pubDate") == "Thu, 05 Jan 2023 00:00:00 +0000"
+        assert items[2].find("pubDate") is None